@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+from mock_site import MockSite, PIXEL_PNG
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 로컬 흉내 서버(mock_site.py)에 headless 크롬으로 글을 올려 처리량을 잰다
+# 사용법: python benchmark.py --posts 20 --workers 2 --images 3 --latency 0.05
+#         python benchmark.py --json result.json
+#         python benchmark.py --baseline result.json   (처리량이 떨어지면 종료 코드 1)
+
+
+def process_tree_rss_mb():
+    if psutil is None:
+        import resource
+        # psutil 이 없으면 자기 자신과 끝난 자식 프로세스의 최대값만 알 수 있다
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss + \
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        return usage / 1024
+    process = psutil.Process()
+    total = 0
+    for p in [process] + process.children(recursive=True):
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+
+class MemorySampler(threading.Thread):
+    def __init__(self, interval=0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak_mb = max(self.peak_mb, process_tree_rss_mb())
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.peak_mb = max(self.peak_mb, process_tree_rss_mb())
+
+
+RESULTS_LOCK = threading.Lock()
+
+
+def count_result(results, key):
+    with RESULTS_LOCK:
+        results[key] += 1
+
+
+def make_sample_files(directory, images, videos):
+    paths = []
+    for index in range(images):
+        path = os.path.join(directory, f"image_{index}.png")
+        with open(path, 'wb') as file:
+            file.write(PIXEL_PNG)
+        paths.append(path)
+    for index in range(videos):
+        path = os.path.join(directory, f"video_{index}.mp4")
+        with open(path, 'wb') as file:
+            file.write(os.urandom(64 * 1024))
+        paths.append(path)
+    return paths
+
+
+def browser_worker(main, args, job, targets, poster, results):
+    driver = main.create_chrome(headless=not args.headed, lean=args.lean)
+    try:
+        if job.login:
+            driver.get(main.BASE_URL + "/")
+            if not poster.login(driver, job):
+                count_result(results, 'failed')
+                return
+        while True:
+            try:
+                name, url = targets.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                with poster.run_timer.gallery(name), poster.run_timer.span('post'):
+                    with poster.run_timer.span('open_gallery'):
+                        poster.open_gallery(driver, url)
+                    poster.post_content(driver, job)
+                count_result(results, 'success')
+            except Exception as e:
+                count_result(results, 'failed')
+                print(f"[ERROR] {name}: {e!r}", file=sys.stderr)
+    finally:
+        driver.quit()
+
+
+def http_worker(main, args, job, targets, poster, results):
+    with poster.session() as session:
+        if job.login:
+            poster.login(session, job)
+        while True:
+            try:
+                name, url = targets.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                with poster.run_timer.gallery(name), poster.run_timer.span('post'):
+                    poster.post_content(session, job, url)
+                count_result(results, 'success')
+            except Exception as e:
+                count_result(results, 'failed')
+                print(f"[ERROR] {name}: {e!r}", file=sys.stderr)
+
+
+def run_benchmark(args):
+    site = MockSite(latency=args.latency, upload_latency=args.upload_latency)
+    base_url = site.start()
+    # main.py 는 import 할 때 BASE_URL 을 읽으므로 그 전에 주소를 바꾼다
+    os.environ['DCPOST_BASE_URL'] = base_url
+    import main
+
+    sample_dir = tempfile.mkdtemp(prefix='dcpost-bench-')
+    media_items = [main.FileItem(path=path) for path in make_sample_files(sample_dir, args.images, args.videos)]
+    text_item = main.FileItem(content=args.text)
+    # --media-first 면 첨부를 본문 글보다 앞에 두어 첨부 자리 순서도 함께 잰다
+    file_list = media_items + [text_item] if args.media_first else [text_item] + media_items
+    job = main.PostJob(nickname='bench', password='bench1234', title='benchmark', file_list=tuple(file_list),
+                       font_size=args.font_size, bold=args.bold, center=args.center, login=args.login)
+
+    targets = queue.Queue()
+    galleries = list(site.galleries.items())
+    for index in range(args.posts):
+        name, gallery_id = galleries[index % len(galleries)]
+        targets.put((f"{name}#{index + 1}", f"{base_url}/board/lists/?id={gallery_id}"))
+
+    run_timer = main.RunTimer()
+    media_cache = main.MediaCache()
+    log = (lambda message: None) if args.quiet else print
+    if args.engine == 'http':
+        poster = main.HttpPoster(base_url=base_url, media_cache=media_cache, run_timer=run_timer)
+        worker_target = http_worker
+    else:
+        poster = main.BrowserPoster(log, media_cache, run_timer, lean=args.lean, pipeline=args.pipeline)
+        worker_target = browser_worker
+
+    results = {'success': 0, 'failed': 0}
+    sampler = MemorySampler()
+    sampler.start()
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker_target, args=(main, args, job, targets, poster, results))
+               for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    sampler.stop()
+    poster.close()
+    site.stop()
+
+    return {
+        'engine': args.engine,
+        'workers': args.workers,
+        'posts': args.posts,
+        'success': results['success'],
+        'failed': results['failed'],
+        'server_posts': len(site.posts),
+        'server_uploads': len(site.uploads),
+        'elapsed': elapsed,
+        'posts_per_minute': results['success'] / elapsed * 60 if elapsed else 0.0,
+        'peak_memory_mb': sampler.peak_mb,
+        'stages': run_timer.stages(),
+        'settings': {'latency': args.latency, 'upload_latency': args.upload_latency,
+                     'images': args.images, 'videos': args.videos, 'lean': args.lean,
+                     'pipeline': args.pipeline, 'login': args.login,
+                     'media_first': args.media_first},
+    }
+
+
+def print_result(result):
+    print(f"엔진 {result['engine']}, 워커 {result['workers']}개")
+    print(f"성공 {result['success']} / 실패 {result['failed']} (서버 기록 {result['server_posts']}개, "
+          f"업로드 {result['server_uploads']}개)")
+    print(f"소요 {result['elapsed']:.1f}초, 분당 {result['posts_per_minute']:.1f}개, "
+          f"최대 메모리 {result['peak_memory_mb']:.0f}MB")
+    print(f"{'단계':<16}{'횟수':>6}{'p50':>9}{'p95':>9}{'max':>9}")
+    for stage, stats in sorted(result['stages'].items(), key=lambda pair: pair[1]['total'], reverse=True):
+        print(f"{stage:<16}{stats['count']:>6}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['max']:>9.3f}")
+
+
+def compare_baseline(result, baseline, tolerance):
+    # 처리량이 tolerance 이상 떨어지거나 글 하나의 p95 가 그만큼 늘면 회귀로 본다
+    problems = []
+    if result['posts_per_minute'] < baseline['posts_per_minute'] * (1 - tolerance):
+        problems.append(f"분당 글 수 {baseline['posts_per_minute']:.1f} -> {result['posts_per_minute']:.1f}")
+    old_post = baseline['stages'].get('post')
+    new_post = result['stages'].get('post')
+    if old_post and new_post and new_post['p95'] > old_post['p95'] * (1 + tolerance):
+        problems.append(f"글 p95 {old_post['p95']:.2f}s -> {new_post['p95']:.2f}s")
+    return problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="로컬 흉내 서버로 글쓰기 처리량 측정")
+    parser.add_argument('--engine', choices=['browser', 'http'], default='browser')
+    parser.add_argument('--posts', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--images', type=int, default=2, help="글마다 올릴 이미지 수")
+    parser.add_argument('--videos', type=int, default=0, help="글마다 올릴 동영상 수")
+    parser.add_argument('--text', default="벤치마크 본문\n두 번째 줄")
+    parser.add_argument('--font-size', default='14px')
+    parser.add_argument('--bold', action='store_true')
+    parser.add_argument('--center', action='store_true')
+    parser.add_argument('--latency', type=float, default=0.0, help="서버 응답 지연(초)")
+    parser.add_argument('--upload-latency', type=float, default=None, help="업로드 응답 지연(초)")
+    parser.add_argument('--media-first', action='store_true', help="첨부 파일을 본문 글보다 앞에 둔다")
+    parser.add_argument('--login', action='store_true', help="흉내 서버에 로그인해서 회원 글쓰기 화면으로 실행")
+    parser.add_argument('--headed', action='store_true', help="크롬 창을 띄워서 실행")
+    parser.add_argument('--lean', action='store_true', help="가벼운 브라우저 프로필로 실행")
+    parser.add_argument('--pipeline', action='store_true', help="첨부 파일을 글 쓰는 동안 미리 올린다")
+    parser.add_argument('--quiet', action='store_true')
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    print_result(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            problems = compare_baseline(result, json.load(file), args.tolerance)
+        for problem in problems:
+            print(f"[REGRESSION] {problem}")
+        if problems:
+            sys.exit(1)
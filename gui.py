@@ -0,0 +1,630 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import wx
+import wx._xml
+import wx.richtext as rt
+from main import (Image, requests, PostRunner, LogSink, FileItem, PostJob, RunOptions, GalleryList, snapshot_job,
+                  iter_line_batches, optimize_image, ENGINE_LABELS, ENGINE_BROWSER, ENGINE_HTTP, FONT_SIZES,
+                  MAX_WORKERS, POOL_WARM_SIZE, IMAGE_OPTIMIZE_WORKERS, LOG_FLUSH_INTERVAL_MS, LOG_FLUSH_BATCH,
+                  LOG_MAX_LINES, LOG_FILE_PATH, RATE_ACCOUNT_PER_MINUTE, JOB_DONE, JOB_FAILED,
+                  USES_TEST_SERVER)
+
+# 글쓰기 창. 배치 실행(python main.py 작업파일.json)은 이 모듈을 불러오지 않는다
+
+GALLERY_STATUS_LABELS = {JOB_DONE: "성공", JOB_FAILED: "실패"}
+
+class GalleryListCtrl(wx.ListCtrl):
+    # 수천 줄이어도 보이는 줄만 그리는 가상 목록. 내용은 GalleryList 에서 읽는다
+    def __init__(self, parent, gallery_list):
+        super(GalleryListCtrl, self).__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL)
+        self.gallery_list = gallery_list
+        self.InsertColumn(0, "갤러리", width=200)
+        self.InsertColumn(1, "상태", width=60)
+        self.done_attr = wx.ItemAttr()
+        self.done_attr.SetTextColour(wx.Colour(0, 128, 0))
+        self.failed_attr = wx.ItemAttr()
+        self.failed_attr.SetTextColour(wx.RED)
+
+    def OnGetItemText(self, item, column):
+        if column == 0:
+            return self.gallery_list.names[item]
+        return GALLERY_STATUS_LABELS.get(self.gallery_list.status(item), "대기")
+
+    def OnGetItemAttr(self, item):
+        status = self.gallery_list.status(item)
+        if status == JOB_DONE:
+            return self.done_attr
+        if status == JOB_FAILED:
+            return self.failed_attr
+        return None
+
+    def selected_indexes(self):
+        indexes = []
+        index = self.GetFirstSelected()
+        while index != -1:
+            indexes.append(index)
+            index = self.GetNextSelected(index)
+        return indexes
+
+    def sync(self):
+        self.SetItemCount(len(self.gallery_list))
+        self.Refresh()
+
+class PostApp(wx.Frame):
+    def __init__(self, parent, title):
+        super(PostApp, self).__init__(parent, title=title, size=(800, 550))
+        self.file_list = []
+        self.image_pool = None
+        self.log_sink = LogSink()
+        self.runner = PostRunner(self.append_log, progress=self.report_progress,
+                                 gallery_status=self.report_gallery_status)
+        self.running = False
+        self.gallery_list = GalleryList()
+        # 목록 파일을 읽는 중이면 그 번호. 새 파일을 고르면 앞의 읽기 결과는 버린다
+        self.gallery_load_id = 0
+        self.gallery_loading = False
+        self.log_line_count = 0
+        self.InitUI()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.log_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.flush_log, self.log_timer)
+        self.log_timer.Start(LOG_FLUSH_INTERVAL_MS)
+        self.Centre()
+        self.Show()
+        # 첫 실행 전에 브라우저를 미리 띄워둔다
+        threading.Thread(target=self.runner.driver_pool.warm, args=(POOL_WARM_SIZE,), daemon=True).start()
+        wx.CallAfter(self.offer_resume)
+
+    def InitUI(self):
+        panel = wx.Panel(self)
+        hbox = wx.BoxSizer(wx.HORIZONTAL)
+        leftvbox = wx.BoxSizer(wx.VERTICAL)
+        rightvbox = wx.BoxSizer(wx.VERTICAL)
+
+        login_check_hbox = wx.BoxSizer(wx.HORIZONTAL)
+
+        nickName_label = wx.StaticText(panel, label="닉네임(Id)")
+
+        login_check_hbox.Add(nickName_label, flag=wx.LEFT, border=10)
+
+        login_check_hbox.AddStretchSpacer(1)
+
+        self.login_check = wx.CheckBox(panel, label="로그인하기")
+
+        self.login_check.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
+
+        login_check_hbox.Add(self.login_check, flag=wx.RIGHT, border=10)
+
+        leftvbox.Add(login_check_hbox, proportion=0, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=0)
+
+        self.nickName_entry = wx.TextCtrl(panel)
+        leftvbox.Add(self.nickName_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
+
+        password_input_label = wx.StaticText(panel, label="비밀번호")
+        leftvbox.Add(password_input_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.password_input_entry = wx.TextCtrl(panel)
+        leftvbox.Add(self.password_input_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
+
+        title_input_label = wx.StaticText(panel, label="제목")
+        leftvbox.Add(title_input_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.title_input_entry = wx.TextCtrl(panel)
+        leftvbox.Add(self.title_input_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
+
+        upload_btn = wx.Button(panel, label="이미지 업로드")
+        upload_btn.Bind(wx.EVT_BUTTON, self.upload_image)
+
+        leftvbox.Add(upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.optimize_checkbox = wx.CheckBox(panel, label="이미지 최적화 (크기 줄이기)")
+        if Image is None:
+            self.optimize_checkbox.Disable()
+        else:
+            self.optimize_checkbox.SetValue(True)
+        leftvbox.Add(self.optimize_checkbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.video_upload_btn = wx.Button(panel, label="비디오 업로드")
+        self.video_upload_btn.Bind(wx.EVT_BUTTON, self.upload_video)
+        self.video_upload_btn.Disable()
+
+        leftvbox.Add(self.video_upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        load_btn = wx.Button(panel, label="txt 파일 업로드")
+        load_btn.Bind(wx.EVT_BUTTON, self.load_file)
+
+        leftvbox.Add(load_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        # 이미지 목록 박스 추가
+        self.file_listbox = wx.ListBox(panel)
+        leftvbox.Add(self.file_listbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        image_list_hbox = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.up_button = wx.Button(panel, label="Up")
+        self.down_button = wx.Button(panel, label="Down")
+        self.delete_button = wx.Button(panel, label="Delete")
+
+        self.up_button.Bind(wx.EVT_BUTTON, self.on_move_up)
+        self.down_button.Bind(wx.EVT_BUTTON, self.on_move_down)
+        self.delete_button.Bind(wx.EVT_BUTTON, self.on_delete_selected)
+
+        image_list_hbox.Add(self.up_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
+        image_list_hbox.Add(self.down_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
+        image_list_hbox.Add(self.delete_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
+
+        leftvbox.Add(image_list_hbox, proportion=0, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        left_header_hbox = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.center_checkbox = wx.CheckBox(panel, label="중앙 정렬")
+        left_header_hbox.Add(self.center_checkbox, proportion=1,
+                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.font_weight_checkbox = wx.CheckBox(panel, label="굵게 쓰기")
+        left_header_hbox.Add(self.font_weight_checkbox, proportion=1,
+                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        font_size_label = wx.StaticText(panel, label="글자 크기:")
+        left_header_hbox.Add(font_size_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.sample_choice = wx.Choice(panel,
+                                       choices=FONT_SIZES)
+        left_header_hbox.Add(self.sample_choice, proportion=1,
+                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        leftvbox.Add(left_header_hbox, proportion=0, flag=wx.EXPAND | wx.ALL, border=10)
+
+        upload_btn = wx.Button(panel, label="글 업로드")
+        upload_btn.Bind(wx.EVT_BUTTON, self.upload_content)
+        leftvbox.Add(upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.text_widget = wx.TextCtrl(panel, style=wx.TE_MULTILINE)
+        leftvbox.Add(self.text_widget,  proportion=1, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        run_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        self.run_btn = wx.Button(panel, label="실행")
+        self.run_btn.Bind(wx.EVT_BUTTON, self.run_thread)
+        run_hbox.Add(self.run_btn, proportion=1, flag=wx.RIGHT, border=5)
+        self.cancel_btn = wx.Button(panel, label="취소")
+        self.cancel_btn.Bind(wx.EVT_BUTTON, self.on_cancel)
+        self.cancel_btn.Disable()
+        run_hbox.Add(self.cancel_btn, proportion=1)
+        rightvbox.Add(run_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        progress_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        self.progress_gauge = wx.Gauge(panel, range=1)
+        progress_hbox.Add(self.progress_gauge, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, border=10)
+        self.progress_label = wx.StaticText(panel, label="0/0")
+        progress_hbox.Add(self.progress_label, flag=wx.ALIGN_CENTER_VERTICAL)
+        rightvbox.Add(progress_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        # 동시에 띄울 브라우저(워커) 수
+        worker_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        worker_label = wx.StaticText(panel, label="동시 실행 수")
+        worker_hbox.Add(worker_label, flag=wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, border=10)
+        self.worker_spin = wx.SpinCtrl(panel, min=1, max=MAX_WORKERS, initial=1)
+        worker_hbox.Add(self.worker_spin, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL)
+        rightvbox.Add(worker_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        rate_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        rate_label = wx.StaticText(panel, label="분당 글 수 (계정당)")
+        rate_hbox.Add(rate_label, flag=wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, border=10)
+        self.rate_spin = wx.SpinCtrl(panel, min=1, max=60, initial=RATE_ACCOUNT_PER_MINUTE)
+        rate_hbox.Add(self.rate_spin, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL)
+        rightvbox.Add(rate_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        engine_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        engine_label = wx.StaticText(panel, label="엔진")
+        engine_hbox.Add(engine_label, flag=wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, border=10)
+        self.engine_choice = wx.Choice(panel, choices=list(ENGINE_LABELS.values()))
+        self.engine_choice.SetSelection(0)
+        engine_hbox.Add(self.engine_choice, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL)
+        rightvbox.Add(engine_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.live_summary_checkbox = wx.CheckBox(panel, label="실행 중 소요 시간 요약 표시")
+        rightvbox.Add(self.live_summary_checkbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.lean_browser_checkbox = wx.CheckBox(panel, label="가벼운 브라우저 (광고/목록 이미지 차단)")
+        rightvbox.Add(self.lean_browser_checkbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.pipeline_checkbox = wx.CheckBox(panel, label="첨부 파일 먼저 올리기 (테스트 서버 전용)")
+        if requests is None or not USES_TEST_SERVER:
+            self.pipeline_checkbox.Disable()
+        rightvbox.Add(self.pipeline_checkbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        #갤러라 목록 업로드
+        url_load_btn = wx.Button(panel, label="갤러리 목록 업로드(.txt)")
+        url_load_btn.Bind(wx.EVT_BUTTON, self.on_load)
+        rightvbox.Add(url_load_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        gallery_add_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        self.gallery_entry = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER)
+        self.gallery_entry.Bind(wx.EVT_TEXT_ENTER, self.on_add_gallery)
+        gallery_add_hbox.Add(self.gallery_entry, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, border=5)
+        gallery_add_btn = wx.Button(panel, label="추가")
+        gallery_add_btn.Bind(wx.EVT_BUTTON, self.on_add_gallery)
+        gallery_add_hbox.Add(gallery_add_btn, flag=wx.ALIGN_CENTER_VERTICAL)
+        rightvbox.Add(gallery_add_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        self.gallery_listctrl = GalleryListCtrl(panel, self.gallery_list)
+        rightvbox.Add(self.gallery_listctrl, proportion=1, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        gallery_edit_hbox = wx.BoxSizer(wx.HORIZONTAL)
+        self.gallery_count_label = wx.StaticText(panel, label="갤러리 0개")
+        gallery_edit_hbox.Add(self.gallery_count_label, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL)
+        gallery_delete_btn = wx.Button(panel, label="선택 삭제")
+        gallery_delete_btn.Bind(wx.EVT_BUTTON, self.on_delete_galleries)
+        gallery_edit_hbox.Add(gallery_delete_btn, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT, border=5)
+        gallery_clear_btn = wx.Button(panel, label="비우기")
+        gallery_clear_btn.Bind(wx.EVT_BUTTON, self.on_clear_galleries)
+        gallery_edit_hbox.Add(gallery_clear_btn, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT, border=5)
+        rightvbox.Add(gallery_edit_hbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        log_label = wx.StaticText(panel, label="작업 기록")
+        rightvbox.Add(log_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        self.log_text_widget = rt.RichTextCtrl(panel, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        rightvbox.Add(self.log_text_widget,  proportion=1,flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+
+        hbox.Add(leftvbox, proportion=1, flag=wx.EXPAND | wx.ALL, border=10)
+        hbox.Add(rightvbox, proportion=1, flag=wx.EXPAND | wx.ALL, border=10)
+
+        self.nickName_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
+        self.password_input_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
+        self.title_input_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
+        self.text_widget.Bind(wx.EVT_TEXT, self.on_text_changed)
+        self.on_text_changed(None)
+
+        panel.SetSizer(hbox)
+
+    def add_file(self, path):
+        file_item = FileItem(path=path)
+        self.file_list.append(file_item)
+        return file_item
+
+    def optimize_file(self, file_item):
+        if self.image_pool is None:
+            self.image_pool = ProcessPoolExecutor(max_workers=IMAGE_OPTIMIZE_WORKERS)
+        future = self.image_pool.submit(optimize_image, file_item.path)
+        # 풀 작업이 끝나면 GUI 스레드에서 결과를 반영한다
+        future.add_done_callback(lambda f: wx.CallAfter(self.on_image_optimized, file_item, f))
+
+    def on_image_optimized(self, file_item, future):
+        try:
+            optimized_path = future.result()
+        except Exception as e:
+            self.append_log(f"[ERROR] 이미지 최적화 실패: {os.path.basename(file_item.path)} ({e})")
+            return
+        if optimized_path == file_item.path:
+            return
+        file_item.upload_path = optimized_path
+        before = os.path.getsize(file_item.path) / 1024
+        after = os.path.getsize(optimized_path) / 1024
+        self.append_log(f"이미지 최적화: {os.path.basename(file_item.path)} {before:.0f}KB -> {after:.0f}KB")
+
+    def add_txt_file(self, content):
+        file_item = FileItem(content=content)
+        self.file_list.append(file_item)
+
+    def append_log(self, message):
+        # 어느 스레드에서 불러도 된다. 화면에는 flush_log 가 모아서 쓴다
+        self.log_sink.write(message)
+
+    def flush_log(self, event):
+        entries, dropped = self.log_sink.drain(LOG_FLUSH_BATCH)
+        if not entries and not dropped:
+            return
+
+        default_color = wx.SystemSettings.GetColour(wx.SYS_COLOUR_WINDOWTEXT)
+        self.log_text_widget.Freeze()
+        self.log_text_widget.SetInsertionPointEnd()
+        if dropped:
+            self.log_text_widget.WriteText(f"... 기록 {dropped}줄 생략 (전체 기록: {LOG_FILE_PATH})\n")
+            self.log_line_count += 1
+        for current_time, message in entries:
+            if '[ERROR]' in message:
+                color = wx.RED
+            elif '[SUCCESS]' in message:
+                color = wx.GREEN
+            else:
+                color = default_color
+            self.log_text_widget.BeginTextColour(color)  # 텍스트 색상 시작
+            self.log_text_widget.WriteText("[" + current_time + "]" + message + "\n")
+            self.log_text_widget.EndTextColour()  # 텍스트 색상 종료
+        self.log_line_count += len(entries)
+
+        # 최근 LOG_MAX_LINES 줄만 남긴다
+        excess = self.log_line_count - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text_widget.Remove(0, self.log_text_widget.XYToPosition(0, excess))
+            self.log_line_count = LOG_MAX_LINES
+        self.log_text_widget.ShowPosition(self.log_text_widget.GetLastPosition())
+        self.log_text_widget.Thaw()
+
+    def on_text_changed(self, event):
+        # 필요한 값 입력 확인. 실행 중이거나 목록을 읽는 중에는 누를 수 없다
+        if (not self.running and not self.gallery_loading and
+                self.nickName_entry.GetValue().strip() and
+                self.password_input_entry.GetValue().strip() and
+                self.title_input_entry.GetValue().strip() and
+                len(self.gallery_list) > 0):
+            self.run_btn.Enable()  # Run 버튼 활성화
+        else:
+            self.run_btn.Disable()  # Run 버튼 비활성화
+
+    def on_checkbox_toggle(self, event):
+        if self.login_check.IsChecked():
+            self.video_upload_btn.Enable()
+        else:
+            self.video_upload_btn.Disable()
+
+    def on_close(self, event):
+        self.runner.cancel()
+        self.log_timer.Stop()
+        self.log_sink.close()
+        self.runner.shutdown()
+        if self.image_pool is not None:
+            self.image_pool.shutdown(wait=False, cancel_futures=True)
+        event.Skip()
+
+    def gallery_names(self):
+        return list(self.gallery_list.names)
+
+    def on_gallery_list_changed(self):
+        self.gallery_listctrl.sync()
+        self.gallery_count_label.SetLabel(f"갤러리 {len(self.gallery_list)}개")
+        self.on_text_changed(None)
+
+    def log_gallery_counts(self, counts):
+        skipped = []
+        if counts['duplicate']:
+            skipped.append(f"중복 {counts['duplicate']}개")
+        if counts['invalid']:
+            skipped.append(f"잘못된 줄 {counts['invalid']}개")
+        if skipped:
+            self.append_log(f"갤러리 목록: {', '.join(skipped)}를 건너뛰었습니다")
+
+    def on_add_gallery(self, event):
+        result = self.gallery_list.add(self.gallery_entry.GetValue())
+        if result == 'added':
+            self.gallery_entry.SetValue('')
+            self.on_gallery_list_changed()
+            self.gallery_listctrl.EnsureVisible(len(self.gallery_list) - 1)
+        elif result == 'duplicate':
+            self.append_log(f"이미 목록에 있는 갤러리입니다: {self.gallery_entry.GetValue().strip()}")
+        elif result == 'invalid':
+            self.append_log("[ERROR] 갤러리 이름이 너무 길거나 쓸 수 없는 글자가 있습니다")
+
+    def on_delete_galleries(self, event):
+        indexes = self.gallery_listctrl.selected_indexes()
+        if not indexes:
+            return
+        for index in indexes:
+            self.gallery_listctrl.Select(index, False)
+        self.gallery_list.remove(indexes)
+        self.on_gallery_list_changed()
+
+    def on_clear_galleries(self, event):
+        # 읽고 있던 목록 파일이 있으면 그만 읽는다
+        self.gallery_load_id += 1
+        self.gallery_loading = False
+        self.gallery_list.clear()
+        self.on_gallery_list_changed()
+
+    def report_gallery_status(self, name, status):
+        # 워커 스레드에서 불린다
+        wx.CallAfter(self.update_gallery_status, name, status)
+
+    def update_gallery_status(self, name, status):
+        index = self.gallery_list.set_status(name, status)
+        if index is not None:
+            self.gallery_listctrl.RefreshItem(index)
+
+    def build_job(self):
+        return PostJob(nickname=self.nickName_entry.GetValue(),
+                       password=self.password_input_entry.GetValue(),
+                       title=self.title_input_entry.GetValue(),
+                       file_list=tuple(self.file_list),
+                       font_size=self.sample_choice.GetStringSelection(),
+                       bold=self.font_weight_checkbox.IsChecked(),
+                       center=self.center_checkbox.IsChecked(),
+                       login=self.login_check.IsChecked())
+
+    def offer_resume(self):
+        unfinished = self.runner.job_store.recover()
+        if not unfinished:
+            return
+        remaining = sum(count for _, count in unfinished)
+        self.append_log(f"끝나지 않은 이전 작업이 {remaining}개 있습니다")
+        dialog = wx.MessageDialog(self, f"끝나지 않은 이전 작업 {remaining}개를 이어서 실행할까요?",
+                                  "이어서 실행", wx.YES_NO | wx.ICON_QUESTION)
+        answer = dialog.ShowModal()
+        dialog.Destroy()
+        if answer != wx.ID_YES or self.running:
+            return
+        # 비밀번호는 작업 기록에 없으므로 작업마다 다시 받는다. 취소한 작업은 건너뛴다
+        passwords = {}
+        for campaign_id, _ in unfinished:
+            job, _ = self.runner.job_store.load_campaign(campaign_id)
+            password_dialog = wx.PasswordEntryDialog(self, f"이전 작업 #{campaign_id} ({job.nickname}: {job.title})",
+                                                     "비밀번호")
+            if password_dialog.ShowModal() == wx.ID_OK and password_dialog.GetValue():
+                passwords[campaign_id] = password_dialog.GetValue()
+            password_dialog.Destroy()
+        if passwords:
+            self.start_background(self.runner.resume_campaigns, passwords, self.run_options())
+
+    def run_options(self):
+        # 화면 값은 GUI 스레드에서만 읽는다
+        if self.engine_choice.GetSelection() == list(ENGINE_LABELS).index(ENGINE_HTTP):
+            engine = ENGINE_HTTP
+        else:
+            engine = ENGINE_BROWSER
+        return RunOptions(engine=engine,
+                          workers=self.worker_spin.GetValue(),
+                          live_summary=self.live_summary_checkbox.IsChecked(),
+                          lean_browser=self.lean_browser_checkbox.IsChecked(),
+                          pipeline_uploads=self.pipeline_checkbox.IsChecked(),
+                          posts_per_minute=self.rate_spin.GetValue())
+
+    def start_background(self, target, *args):
+        self.set_running(True)
+        threading.Thread(target=self.run_in_background, args=(target,) + args).start()
+
+    def run_in_background(self, target, *args):
+        try:
+            target(*args)
+        finally:
+            wx.CallAfter(self.set_running, False)
+
+    def set_running(self, running):
+        self.running = running
+        self.cancel_btn.Enable(running)
+        if running:
+            self.update_progress(0, 0)
+        self.on_text_changed(None)
+
+    def report_progress(self, done, total):
+        # 실행 스레드에서 불린다
+        wx.CallAfter(self.update_progress, done, total)
+
+    def update_progress(self, done, total):
+        self.progress_gauge.SetRange(max(total, 1))
+        self.progress_gauge.SetValue(min(done, max(total, 1)))
+        self.progress_label.SetLabel(f"{done}/{total}")
+
+    def on_cancel(self, event):
+        self.cancel_btn.Disable()
+        self.runner.cancel()
+
+    def run_thread(self, event):
+        if self.running:
+            return
+        # 실행을 누른 순간의 값으로 고정한다. 실행 중에 화면을 고쳐도 이번 실행에는 반영되지 않는다
+        job = snapshot_job(self.build_job())
+        self.gallery_list.reset_statuses()
+        self.gallery_listctrl.Refresh()
+        self.start_background(self.runner.run, job, self.gallery_names(), self.run_options())
+    def load_file(self, event):
+        filepath = wx.FileDialog(self, "Open TXT file", wildcard="TXT files (*.txt)|*.txt", style=wx.FD_OPEN)
+        if filepath.ShowModal() == wx.ID_OK:
+            with open(filepath.GetPath(), 'r') as file:
+                content = file.read()
+                self.add_txt_file(content)
+                if len(content) > 8:
+                    extracted_string = content[:8] + "..."
+                else:
+                    extracted_string = content
+                self.file_listbox.Append(extracted_string)
+                # content = file.read()
+                # self.text_widget.SetValue(content)
+        filepath.Destroy()
+
+    def upload_content(self, event):
+        content = self.text_widget.GetValue()
+
+        if content:
+            file_item = FileItem(content=content)
+            self.file_list.append(file_item)
+            if len(content) > 8:
+                extracted_string = content[:8] + "..."
+            else:
+                extracted_string = content
+            self.file_listbox.Append(extracted_string)
+
+        self.text_widget.SetValue('')
+
+    def on_load(self, event):
+        filepath = wx.FileDialog(self, "Open TXT file", wildcard="TXT files (*.txt)|*.txt", style=wx.FD_OPEN)
+        if filepath.ShowModal() == wx.ID_OK:
+            # 새 파일을 고르면 목록을 바꾼다. 큰 파일은 백그라운드에서 나눠 읽어 화면이 멈추지 않게 한다
+            self.gallery_load_id += 1
+            self.gallery_loading = True
+            self.gallery_load_counts = {'added': 0, 'duplicate': 0, 'invalid': 0}
+            self.gallery_list.clear()
+            self.on_gallery_list_changed()
+            threading.Thread(target=self.read_gallery_file, args=(filepath.GetPath(), self.gallery_load_id),
+                             daemon=True).start()
+        filepath.Destroy()
+
+    def read_gallery_file(self, path, load_id):
+        try:
+            for batch in iter_line_batches(path):
+                if load_id != self.gallery_load_id:
+                    return
+                wx.CallAfter(self.add_gallery_batch, load_id, batch)
+        except OSError as e:
+            self.append_log(f"[ERROR] 갤러리 목록을 읽지 못했습니다: {e}")
+        wx.CallAfter(self.finish_gallery_load, load_id)
+
+    def add_gallery_batch(self, load_id, batch):
+        if load_id != self.gallery_load_id:
+            return
+        for result, count in self.gallery_list.extend(batch).items():
+            self.gallery_load_counts[result] += count
+        self.on_gallery_list_changed()
+
+    def finish_gallery_load(self, load_id):
+        if load_id != self.gallery_load_id:
+            return
+        self.gallery_loading = False
+        self.append_log(f"갤러리 목록: {self.gallery_load_counts['added']}개를 불러왔습니다")
+        self.log_gallery_counts(self.gallery_load_counts)
+        self.on_gallery_list_changed()
+
+    def upload_image(self, event):
+        filepath = wx.FileDialog(self, "Open Image file", wildcard="Image files (*.jpg;*.png)|*.jpg;*.png", style=wx.FD_OPEN)
+        if filepath.ShowModal() == wx.ID_OK:
+            # 선택한 이미지의 경로를 리스트에 추가
+            file_item = self.add_file(filepath.GetPath())
+            if self.optimize_checkbox.IsChecked():
+                self.optimize_file(file_item)
+            # self.image_list.append(filepath.GetPath())
+            # 이제 ListBox에도 업로드된 이미지의 경로를 추가
+            self.file_listbox.Append(filepath.GetPath())
+        filepath.Destroy()
+
+    def upload_video(self, event):
+        filepath = wx.FileDialog(self,
+                                 "Open Video file",
+                                 wildcard="Video files (*.mp4;*.avi;*.mov;*.webm)|*.mp4;*.avi;*.mov;*.webm",
+                                 style=wx.FD_OPEN)
+        if filepath.ShowModal() == wx.ID_OK:
+            self.add_file(filepath.GetPath())
+            self.file_listbox.Append(filepath.GetPath())
+        filepath.Destroy()
+
+    def on_move_up(self, event):
+        selection = self.file_listbox.GetSelection()
+        if selection > 0:
+            current_label = self.file_listbox.GetString(selection)
+            self.file_listbox.Delete(selection)
+            self.file_listbox.Insert(current_label, selection - 1)
+            self.file_listbox.SetSelection(selection - 1)
+            self.file_list[selection], self.file_list[selection-1] = self.file_list[selection-1], self.file_list[selection]
+
+    def on_move_down(self, event):
+        selection = self.file_listbox.GetSelection()
+        if selection < (self.file_listbox.GetCount() - 1) and selection != wx.NOT_FOUND:
+            current_label = self.file_listbox.GetString(selection)
+            self.file_listbox.Delete(selection)
+            self.file_listbox.Insert(current_label, selection + 1)
+            self.file_listbox.SetSelection(selection + 1)
+
+            self.file_list[selection], self.file_list[selection + 1] = self.file_list[selection + 1], \
+            self.file_list[selection]
+
+    def on_delete_selected(self, event):
+        selection = self.file_listbox.GetSelection()
+        if selection != wx.NOT_FOUND:
+            self.file_listbox.Delete(selection)
+            del self.file_list[selection]
+
+def run():
+    app = wx.App()
+    PostApp(None, title="Post")
+    app.MainLoop()
+
+if __name__ == '__main__':
+    run()
@@ -1,232 +1,1423 @@
 import time
+# 배치 실행의 시작 준비 시간을 재기 위한 기준 시각 (import 전에 잡는다)
+IMPORT_STARTED_AT = time.perf_counter()
 import os
-import wx
-import wx._xml
-import wx.richtext as rt
+import math
+import json
+import re
+import hashlib
+import base64
+import unicodedata
+from collections import namedtuple
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse, parse_qs
+import sys
+import argparse
+import signal
 import threading
+import queue
+import sqlite3
+import logging
+import logging.handlers
+from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+try:
+    import psutil
+except ImportError:
+    psutil = None
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 from selenium import webdriver
+from selenium.common.exceptions import (WebDriverException, NoSuchElementException, NoAlertPresentException,
+                                        ElementClickInterceptedException, StaleElementReferenceException,
+                                        UnexpectedAlertPresentException, TimeoutException)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-def get_element_by_xpath(driver, xpath, timeout=10):
-    return WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located((By.XPATH, xpath))
-    )
+# 캐시/기록 파일을 두는 폴더
+APP_DIR = os.path.join(os.path.expanduser('~'), '.dcpost')
+# 테스트용 로컬 서버(mock_site.py)를 쓸 때는 DCPOST_BASE_URL 로 바꾼다
+DEFAULT_BASE_URL = 'https://gall.dcinside.com'
+BASE_URL = os.environ.get('DCPOST_BASE_URL', DEFAULT_BASE_URL).rstrip('/')
+# HTTP 엔진과 첨부 파일 먼저 올리기는 테스트 서버의 주소/응답 형식에만 맞춰져 있다
+USES_TEST_SERVER = BASE_URL != DEFAULT_BASE_URL
+GALLERY_INDEX_PATH = os.path.join(APP_DIR, 'gallery_index.json')
+# 갤러리 이름 -> 주소 목록을 다시 수집하기 전까지 유지하는 시간(초)
+GALLERY_INDEX_TTL = 24 * 60 * 60
+# 대상 목록에서 이보다 긴 줄은 갤러리 이름이 아닌 것으로 보고 건너뛴다
+GALLERY_NAME_MAX_LENGTH = 50
+# 큰 대상 목록 파일을 읽을 때 화면에 한 번에 넘기는 줄 수
+GALLERY_LOAD_BATCH = 2000
+# 갤러리 목록을 수집할 페이지 (일반/마이너/미니 갤러리)
+GALLERY_INDEX_PAGES = [
+    BASE_URL + "/",
+    BASE_URL + "/m",
+    BASE_URL + "/n",
+]
+GALLERY_ANCHOR_SCRIPT = """
+    var result = [];
+    document.querySelectorAll('a[href*="board/lists"]').forEach(function (a) {
+        var name = (a.textContent || '').trim();
+        if (name) {
+            result.push([name, a.href]);
+        }
+    });
+    return result;
+"""
+
+# 본문 텍스트를 스크립트 한 번으로 넣는다 (실패하면 send_keys 로 입력)
+FAST_TEXT_INSERT = True
+INSERT_TEXT_SCRIPT = """
+    var body = document.body;
+    var lines = arguments[0].split(/\\r?\\n/);
+    var bold = arguments[1];
+    var fontSize = arguments[2];
+
+    // 아무것도 없는 빈 문단만 있으면 지우고 시작 (먼저 넣은 첨부 자리가 있으면 그대로 둔다)
+    if (!body.textContent.trim() && !body.querySelector('img, iframe, video, embed, [data-dcpost-slot]')) {
+        body.innerHTML = '';
+    }
+
+    var html = lines.map(function (line) {
+        var p = document.createElement('p');
+        if (line) {
+            // 선택을 새로 잡으면 툴바의 입력 상태가 사라지므로 굵게/글자 크기를 직접 감싼다
+            var node = document.createTextNode(line);
+            if (bold) {
+                var b = document.createElement('b');
+                b.appendChild(node);
+                node = b;
+            }
+            if (fontSize) {
+                var span = document.createElement('span');
+                span.style.fontSize = fontSize;
+                span.appendChild(node);
+                node = span;
+            }
+            p.appendChild(node);
+        } else {
+            p.appendChild(document.createElement('br'));
+        }
+        return p.outerHTML;
+    }).join('');
+
+    // 커서를 본문 끝으로 옮긴 뒤 에디터 입력으로 넣어야 변경 감지가 동작한다
+    body.focus();
+    var range = document.createRange();
+    range.selectNodeContents(body);
+    range.collapse(false);
+    var selection = window.getSelection();
+    selection.removeAllRanges();
+    selection.addRange(range);
+
+    var inserted = false;
+    try {
+        inserted = document.execCommand('insertHTML', false, html);
+    } catch (e) {
+        inserted = false;
+    }
+    if (!inserted) {
+        body.insertAdjacentHTML('beforeend', html);
+    }
+    ['input', 'keyup', 'change'].forEach(function (type) {
+        body.dispatchEvent(new Event(type, {bubbles: true}));
+    });
+    return true;
+"""
+
+# 사진 팝업 업로드 대기 시간: 기본 + 사진 한 장당 추가(초)
+IMAGE_UPLOAD_TIMEOUT = 10
+IMAGE_UPLOAD_TIMEOUT_PER_FILE = 5
+VIDEO_UPLOAD_TIMEOUT = 50
+
+# 에디터 본문 노드를 업로드 전에 기억해둔다 (iframe 안에서 실행)
+SNAPSHOT_EDITOR_SCRIPT = """
+    window.__dcpostBefore = Array.prototype.map.call(document.body.childNodes, function (node) {
+        return [node, node.nodeType === 1 ? node.outerHTML : (node.textContent || '')];
+    });
+    return true;
+"""
+# 업로드로 새로 들어간 부분의 HTML (iframe 안에서 실행)
+COLLECT_EDITOR_SCRIPT = """
+    var before = window.__dcpostBefore || [];
+    var html = '';
+    Array.prototype.forEach.call(document.body.childNodes, function (node) {
+        var current = node.nodeType === 1 ? node.outerHTML : (node.textContent || '');
+        var previous = null;
+        for (var i = 0; i < before.length; i++) {
+            if (before[i][0] === node) {
+                previous = before[i][1];
+                break;
+            }
+        }
+        // 새로 생긴 노드이거나, 비어 있던 문단에 미디어가 들어간 경우만 모은다
+        var wasEmpty = previous !== null && !/<(img|iframe|video|embed)/i.test(previous)
+            && !previous.replace(/<[^>]*>/g, '').trim();
+        if (previous === null || (wasEmpty && current !== previous)) {
+            html += current;
+        }
+    });
+    window.__dcpostBefore = null;
+    return html;
+"""
+HIDDEN_INPUTS_SCRIPT = """
+    var form = document.querySelector('#write') || document.forms[0];
+    if (!form) {
+        return [];
+    }
+    return Array.prototype.map.call(form.querySelectorAll('input[type=hidden]'), function (input) {
+        return [input.name, input.value];
+    });
+"""
+# 캐시된 미디어를 본문 끝에 넣는다 (iframe 안에서 실행)
+INSERT_MEDIA_SCRIPT = """
+    var body = document.body;
+    body.insertAdjacentHTML('beforeend', arguments[0]);
+    ['input', 'keyup', 'change'].forEach(function (type) {
+        body.dispatchEvent(new Event(type, {bubbles: true}));
+    });
+    return true;
+"""
+ADD_HIDDEN_INPUTS_SCRIPT = """
+    var form = document.querySelector('#write') || document.forms[0];
+    arguments[0].forEach(function (pair) {
+        var input = document.createElement('input');
+        input.type = 'hidden';
+        input.name = pair[0];
+        input.value = pair[1];
+        form.appendChild(input);
+    });
+    return true;
+"""
+
+# 업로드 파이프라인: 글쓰기 화면이 열리면 첨부 파일을 HTTP 로 먼저 올리고, 본문에는 자리만 잡아둔다
+# 다 쓰고 나면 자리마다 업로드 결과를 넣어서 목록 순서를 그대로 지킨다 (requests 필요)
+UPLOAD_PIPELINE_WORKERS = 4
+UPLOAD_CONTEXT_SCRIPT = """
+    var form = document.querySelector('#write') || document.forms[0];
+    var inputs = form ? Array.prototype.map.call(form.querySelectorAll('input[type=hidden]'), function (input) {
+        return [input.name, input.value];
+    }) : [];
+    return {inputs: inputs, user_agent: navigator.userAgent, url: location.href};
+"""
+# 본문 끝에 자리 표시 문단을 넣는다 (iframe 안에서 실행)
+INSERT_SLOT_SCRIPT = """
+    var body = document.body;
+    // 앞에서 넣은 자리도 빈 문단이라 지우면 안 된다
+    if (!body.textContent.trim() && !body.querySelector('img, iframe, video, embed, [data-dcpost-slot]')) {
+        body.innerHTML = '';
+    }
+    body.insertAdjacentHTML('beforeend', '<p data-dcpost-slot="' + arguments[0] + '"><br></p>');
+    return true;
+"""
+# [[자리 번호, html], ...] 을 받아 자리를 업로드 결과로 바꾼다. 못 찾은 자리 번호를 돌려준다 (iframe 안에서 실행)
+FILL_SLOTS_SCRIPT = """
+    var body = document.body;
+    var missing = [];
+    arguments[0].forEach(function (pair) {
+        var slot = body.querySelector('[data-dcpost-slot="' + pair[0] + '"]');
+        if (!slot) {
+            missing.push(pair[0]);
+            return;
+        }
+        slot.insertAdjacentHTML('beforebegin', pair[1]);
+        slot.parentNode.removeChild(slot);
+    });
+    ['input', 'keyup', 'change'].forEach(function (type) {
+        body.dispatchEvent(new Event(type, {bubbles: true}));
+    });
+    return missing;
+"""
+# 팝업으로 다시 올린 경우, SNAPSHOT_EDITOR_SCRIPT 이후 새로 생긴 노드를 자리로 옮긴다 (iframe 안에서 실행)
+MOVE_TO_SLOT_SCRIPT = """
+    var slot = document.body.querySelector('[data-dcpost-slot="' + arguments[0] + '"]');
+    var before = (window.__dcpostBefore || []).map(function (pair) { return pair[0]; });
+    window.__dcpostBefore = null;
+    if (!slot) {
+        return false;
+    }
+    Array.prototype.slice.call(document.body.childNodes).forEach(function (node) {
+        if (node !== slot && before.indexOf(node) < 0) {
+            slot.parentNode.insertBefore(node, slot);
+        }
+    });
+    slot.parentNode.removeChild(slot);
+    return true;
+"""
+
+# 글 서식: 툴바 클릭과 가운데 정렬을 각각 스크립트 한 번으로 처리하고 바꾼 개수를 돌려받는다
+FONT_SIZES = ["8px", "9px", "10px", "11px", "12px", "14px", "18px", "24px", "36px"]
+FONT_SIZE_XPATH = '//*[@id="tx_fontsize_menu"]/ul/li[{index}]/a'
+VIDEO_THUMB_SELECTOR = '.video_inbox.dc_movie_thumbox'
+# 굵게/글자 크기는 에디터의 입력 상태라 본문을 넣기 전에 누른다. 못 찾은 버튼은 missing 으로 돌려준다
+TOOLBAR_FORMAT_SCRIPT = """
+    var result = {bold: 0, font_size: 0, missing: []};
+    function find(xpath) {
+        return document.evaluate(xpath, document, null,
+                                 XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    function press(name, xpath) {
+        var node = find(xpath);
+        if (!node) {
+            result.missing.push(name);
+            return false;
+        }
+        node.click();
+        return true;
+    }
+    if (arguments[0] && press('bold', arguments[0])) {
+        result.bold = 1;
+    }
+    if (arguments[2] && press('font_size_list', arguments[1]) && press('font_size', arguments[2])) {
+        result.font_size = 1;
+    }
+    return result;
+"""
+# 에디터 iframe 안에서 실행한다. 이미 가운데 정렬된 것은 세지 않는다
+CENTER_CONTENT_SCRIPT = """
+    var counts = {images: 0, videos: 0, paragraphs: 0};
+    function center(node, key) {
+        if (node && node.style.textAlign !== 'center') {
+            node.style.textAlign = 'center';
+            counts[key] += 1;
+        }
+    }
+    document.querySelectorAll('img.txc-image').forEach(function (img) {
+        center(img.parentNode, 'images');
+    });
+    document.querySelectorAll(arguments[0]).forEach(function (video) {
+        center(video.parentNode, 'videos');
+    });
+    document.querySelectorAll('p').forEach(function (p) {
+        center(p, 'paragraphs');
+    });
+    return counts;
+"""
+
+# 업로드 전 이미지 최적화 (Pillow 필요)
+IMAGE_CACHE_DIR = os.path.join(APP_DIR, 'images')
+IMAGE_MAX_DIMENSION = 2048
+IMAGE_JPEG_QUALITY = 85
+IMAGE_OPTIMIZE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# 글쓰기 엔진
+ENGINE_BROWSER = 'browser'
+ENGINE_HTTP = 'http'
+ENGINE_LABELS = {ENGINE_BROWSER: "브라우저", ENGINE_HTTP: "HTTP (실험용, 테스트 서버 전용)"}
+# HTTP 엔진이 쓰는 주소. {board} 는 갤러리 종류별 경로(/board, /mgallery/board ...)
+# 실제 사이트에서 확인한 값이 아니라 mock_site.py 와 맞춘 값이다 (응답 형식 "true||", files[].web__url 포함).
+# 실제 사이트는 회원 로그인이 다른 호스트에 있어 지금은 테스트 서버에서만 동작한다.
+# 첨부 파일 먼저 올리기(파이프라인)도 이 업로드 주소를 쓰지만, 실패하면 팝업으로 다시 올린다
+HTTP_ENDPOINTS = {
+    'login': '/login/member_check',
+    'write': '{board}/write/?id={gallery_id}',
+    'submit': '{board}/forms/article_submit',
+    'image_upload': '/upload/image_upload?id={gallery_id}',
+    'movie_upload': '/upload/movie_upload?id={gallery_id}',
+}
+HTTP_TIMEOUT = 30
+HTTP_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# 작업 기록: 워커는 버퍼에 쌓고 GUI 타이머가 모아서 화면에 쓴다
+LOG_BUFFER_SIZE = 5000
+LOG_FLUSH_INTERVAL_MS = 200
+LOG_FLUSH_BATCH = 500
+LOG_MAX_LINES = 2000
+LOG_FILE_PATH = os.path.join(APP_DIR, 'logs', 'dcpost.log')
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+
+# 실행 보고서 (단계별 소요 시간)
+REPORT_DIR = os.path.join(APP_DIR, 'reports')
+
+# 로그인 쿠키 저장소: 계정별 파일을 비밀번호로 만든 키로 암호화한다 (cryptography 패키지 필요)
+COOKIE_STORE_DIR = os.path.join(APP_DIR, 'sessions')
+COOKIE_KEY_ITERATIONS = 200000
+# 로그인된 화면에만 있는 로그아웃 링크로 저장된 쿠키가 살아있는지 확인한다
+LOGGED_IN_SELECTOR = 'a[href*="logout"]'
+LOGGED_IN_PATTERN = re.compile(r'href="[^"]*logout')
+LIVE_SUMMARY_INTERVAL = 15
+REPORT_SLOWEST_GALLERIES = 10
+
+# 요소 대기: 선택자마다 관찰한 p95 의 몇 배 + 여유(초)로 줄인다. 표본이 적으면 기본값 사용
+DEFAULT_WAIT_TIMEOUT = 10
+ADAPTIVE_MIN_SAMPLES = 5
+ADAPTIVE_MAX_SAMPLES = 200
+ADAPTIVE_TIMEOUT_FACTOR = 3
+ADAPTIVE_TIMEOUT_MARGIN = 2
+ADAPTIVE_TIMEOUT_MIN = 2
+PROBE_SELECTORS_SCRIPT = """
+    var xpaths = arguments[0];
+    for (var i = 0; i < xpaths.length; i++) {
+        var node = document.evaluate(xpaths[i], document, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (node) {
+            return i;
+        }
+    }
+    return -1;
+"""
+# 글쓰기 화면 구조. 비로그인 화면은 비밀번호 입력칸이 있고, 로그인 화면은 제목칸만 있다
+# 로그인 화면에서는 첫 줄 첫 입력칸이 제목칸이므로, 비로그인 화면에만 있는 두 번째 줄(비밀번호)로 구분한다
+WRITE_FORM_LAYOUTS = [
+    ('anonymous', '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[2]/input'),
+    ('member', '//*[@id="subject"]'),
+]
+LAYOUT_XPATHS = {
+    'anonymous': {
+        'font_weight': "/html/body/div[2]/main/section/article[2]/form/div[3]/div/div[2]/div/ul[3]/li[1]/div/a",
+        'font_size_list': "/html/body/div[2]/main/section/article[2]/form/div[3]/div/div[2]/div/ul[2]/li/div[1]/a",
+        'apply_button': '//*[@id="write"]/div[5]/button[2]',
+    },
+    'member': {
+        'font_weight': "/html/body/div[2]/main/section/article[2]/form/div[4]/div/div[2]/div/ul[3]/li[1]/div/a",
+        'font_size_list': "/html/body/div[2]/main/section/article[2]/form/div[4]/div/div[2]/div/ul[2]/li/div[1]/a",
+        'apply_button': "/html/body/div[2]/main/section/article[2]/form/div[6]/button[2]",
+    },
+}
+
+MAX_WORKERS = 8
+# 갤러리별 작업 기록 (중간에 꺼져도 이어서 실행)
+JOB_DB_PATH = os.path.join(APP_DIR, 'jobs.db')
+# 일시적인 오류로 실패한 작업을 다시 시도하는 최대 횟수와 대기 시간(초)
+JOB_MAX_ATTEMPTS = 4
+JOB_BACKOFF_BASE = 5
+JOB_BACKOFF_MAX = 300
+# 실행 중인 작업은 JOB_LEASE_RENEW 초마다 갱신한다. JOB_LEASE_SECONDS 동안 갱신이 없으면 주인이 꺼진 것으로 본다
+JOB_LEASE_SECONDS = 90
+JOB_LEASE_RENEW = 15
+# 프로그램 시작 시 미리 띄워둘 브라우저 수
+POOL_WARM_SIZE = 1
+# 이 횟수만큼 글을 올린 브라우저는 새로 띄운다
+POOL_MAX_POSTS = 50
+# 처음 띄웠을 때보다 메모리가 이만큼(MB) 늘어난 브라우저는 새로 띄운다 (psutil 필요)
+POOL_MAX_MEMORY_GROWTH_MB = 500
+
+# 가벼운 브라우저 프로필: DOMContentLoaded 까지만 기다리고, 광고/추적 주소와 이동용 화면(메인/목록)의 이미지를 막는다
+# 글쓰기 화면과 업로드 팝업은 이미지를 그대로 받는다. 막을 주소는 BLOCKLIST_PATH 에 한 줄씩 더 적을 수 있다
+BLOCKLIST_PATH = os.path.join(APP_DIR, 'blocklist.txt')
+DEFAULT_BLOCKED_URLS = [
+    '*addc.dcinside.com*',
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*googletagmanager.com*',
+    '*googletagservices.com*',
+    '*google-analytics.com*',
+    '*adservice.google.*',
+    '*criteo.*',
+    '*taboola.com*',
+    '*dable.io*',
+    '*mobon.net*',
+    '*scorecardresearch.com*',
+    '*facebook.net*',
+]
+NAVIGATION_IMAGE_PATTERNS = ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.svg*']
+# 프로필별 목록 화면 로딩 시간(p50)을 남겨서 다음 실행과 비교한다
+PAGE_LOAD_STATS_PATH = os.path.join(APP_DIR, 'page_load.json')
+# 글 등록 완료 신호별 대기 시간(초)
+SUBMIT_TIMEOUTS = {
+    'alert': 5,   # 오류 알림창
+    'url': 20,    # 주소 변경
+    'list': 20,   # 글 목록 페이지 표시
+}
+SUBMIT_POLL_INTERVAL = 0.1
+POST_LIST_SELECTOR = 'table.gall_list'
+
+# 게시 속도 조절: 계정별 토큰 버킷 + 갤러리별 최소 간격. 도배 방지/캡차가 보이면 속도를 낮추고 잠시 쉰다
+RATE_ACCOUNT_PER_MINUTE = 4
+RATE_ACCOUNT_BURST = 2
+RATE_GALLERY_INTERVAL = 60
+RATE_BACKOFF_FACTOR = 0.5
+RATE_MIN_FACTOR = 0.1
+# 연속으로 성공할 때마다 속도를 이만큼 되돌린다
+RATE_RECOVERY_STEP = 0.1
+RATE_THROTTLE_PAUSE = 60
+# 도배/자동입력 방지 문구만 속도 제한으로 본다. 본인인증이 필요한 갤러리 같은 거절은 SubmitError 로 끝낸다
+THROTTLE_PATTERNS = ['도배', '자동입력 방지', '자동 입력 방지', '자동입력방지', '너무 빠르게', '너무 자주',
+                     'captcha', 'too many requests']
+THROTTLE_STATUS_CODES = (429, 503)
+CAPTCHA_SELECTOR = '#kcaptcha, .kcaptcha, input[name="kcaptcha_code"], iframe[src*="recaptcha"]'
+
+class SelectorStats:
+    # 실행 중 선택자별로 요소가 나타나기까지 걸린 시간을 모아서 대기 시간을 정한다
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=ADAPTIVE_MAX_SAMPLES))
+
+    def record(self, key, seconds):
+        with self.lock:
+            self.samples[key].append(seconds)
+
+    def timeout(self, key, default):
+        with self.lock:
+            samples = list(self.samples.get(key, ()))
+        if len(samples) < ADAPTIVE_MIN_SAMPLES:
+            return default
+        adaptive = percentile(samples, 0.95) * ADAPTIVE_TIMEOUT_FACTOR + ADAPTIVE_TIMEOUT_MARGIN
+        return min(default, max(ADAPTIVE_TIMEOUT_MIN, adaptive))
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+selector_stats = SelectorStats()
+
+def wait_until(driver, key, condition, timeout=None, default=DEFAULT_WAIT_TIMEOUT):
+    # timeout 을 주지 않으면 지금까지 본 대기 시간으로 정한다
+    if timeout is None:
+        timeout = selector_stats.timeout(key, default)
+    start = time.perf_counter()
+    try:
+        result = WebDriverWait(driver, timeout).until(condition)
+    except TimeoutException:
+        # 시간 초과도 기록해야 사이트가 느려졌을 때 대기 시간이 다시 늘어난다
+        selector_stats.record(key, time.perf_counter() - start)
+        raise
+    selector_stats.record(key, time.perf_counter() - start)
+    return result
+
+def get_element_by_xpath(driver, xpath, timeout=None, default=DEFAULT_WAIT_TIMEOUT):
+    return wait_until(driver, xpath, EC.presence_of_element_located((By.XPATH, xpath)), timeout, default)
+
+def get_clickable_element_by_xpath(driver, xpath, timeout=None, default=DEFAULT_WAIT_TIMEOUT):
+    return wait_until(driver, 'clickable:' + xpath, EC.element_to_be_clickable((By.XPATH, xpath)), timeout, default)
+
+def probe_selectors(driver, candidates, timeout=None, default=DEFAULT_WAIT_TIMEOUT):
+    # 후보 XPath 들을 스크립트 한 번으로 같이 확인하고, 먼저 있는(우선순위 높은) 후보의 이름을 돌려준다
+    names = [name for name, _ in candidates]
+    xpaths = [xpath for _, xpath in candidates]
+    key = 'probe:' + '|'.join(xpaths)
+
+    def found(d):
+        index = d.execute_script(PROBE_SELECTORS_SCRIPT, xpaths)
+        return index + 1 if index >= 0 else False
+
+    start = time.perf_counter()
+    try:
+        index = wait_until(driver, key, found, timeout, default) - 1
+    except TimeoutException:
+        raise TimeoutException(f"none of {names} found")
+    return names[index], time.perf_counter() - start
+
+def click_when_ready(driver, xpath, timeout=10):
+    # 다른 요소에 가려져 클릭이 막히면 풀릴 때까지 다시 시도
+    def click(d):
+        element = d.find_element(By.XPATH, xpath)
+        if not (element.is_displayed() and element.is_enabled()):
+            return False
+        element.click()
+        return True
+
+    WebDriverWait(driver, timeout, ignored_exceptions=(NoSuchElementException,
+                                                       ElementClickInterceptedException,
+                                                       StaleElementReferenceException)).until(click)
+
+class SubmitError(Exception):
+    pass
+
+class ThrottledError(Exception):
+    # 사이트가 속도 제한/캡차로 막은 경우. 잠시 후 다시 시도하면 올라갈 수 있다
+    pass
+
+class RunCancelled(Exception):
+    # 실행 취소. 단계가 끝나는 곳에서만 던지므로 올리던 글은 다음 실행 때 처음부터 다시 올린다
+    pass
+
+def check_cancel(cancel):
+    if cancel is not None and cancel.is_set():
+        raise RunCancelled()
+
+def is_throttle_message(message):
+    message = (message or '').lower()
+    return any(pattern in message for pattern in THROTTLE_PATTERNS)
+
+def submit_error(message):
+    if is_throttle_message(message):
+        return ThrottledError(message)
+    return SubmitError(message)
+
+def wait_for_submit(driver, before_url, timeouts=SUBMIT_TIMEOUTS):
+    # 등록 버튼 클릭 후 주소 변경 / 글 목록 표시 / 오류 알림창 중 먼저 오는 신호를 기다린다
+    start = time.monotonic()
+    while True:
+        elapsed = time.monotonic() - start
+        active = [signal for signal, timeout in timeouts.items() if elapsed < timeout]
+        if not active:
+            raise TimeoutException(f"submit not confirmed after {elapsed:.1f}s")
 
-def get_clickable_element_by_xpath(driver, xpath, timeout=10):
-    return WebDriverWait(driver, timeout).until(
-        EC.element_to_be_clickable((By.XPATH, xpath))
+        try:
+            if 'alert' in active:
+                try:
+                    alert = driver.switch_to.alert
+                    message = alert.text
+                    alert.accept()
+                    raise submit_error(message)
+                except NoAlertPresentException:
+                    pass
+            if 'url' in active and driver.current_url != before_url:
+                return 'url', elapsed
+            if 'list' in active and driver.find_elements(By.CSS_SELECTOR, POST_LIST_SELECTOR):
+                return 'list', elapsed
+        except UnexpectedAlertPresentException as e:
+            raise submit_error(e.alert_text or str(e))
+
+        time.sleep(SUBMIT_POLL_INTERVAL)
+
+def wait_for_thumbnails(driver, count, timeout):
+    # 업로드 시간은 선택자가 아니라 파일 크기에 달려 있으므로 배운 값을 쓰지 않고 정해진 시간만큼 기다린다
+    WebDriverWait(driver, timeout).until(
+        lambda d: len(d.find_elements(By.CSS_SELECTOR, '#sortable li img')) >= count
     )
 
-class FileItem:
-    def __init__(self, path=None, content=None):
-        self.path = path
-        self.content = content
-
-        if self.path:
-            self.type = self.determine_file_type()
-        elif self.content:
-            self.type = 'text'
-
-    def determine_file_type(self):
-        _, ext = os.path.splitext(self.path)
-        if ext in ['.jpg', '.png']:
-            return 'image'
-        elif ext == '.txt':
-            return 'text'
-        elif ext in ['.mp4']:
-            return 'video'
-        else:
-            return 'unknown'
-
-    def __str__(self):
-        return self.path or self.content
-
-    def count_image_types(file_items):
-        return sum(1 for item in file_items if item.type == "image")
-
-class PostApp(wx.Frame):
-    def __init__(self, parent, title):
-        super(PostApp, self).__init__(parent, title=title, size=(800, 550))
-        self.file_list = []
-        self.InitUI()
-        self.Centre()
-        self.Show()
-
-    def InitUI(self):
-        panel = wx.Panel(self)
-        hbox = wx.BoxSizer(wx.HORIZONTAL)
-        leftvbox = wx.BoxSizer(wx.VERTICAL)
-        rightvbox = wx.BoxSizer(wx.VERTICAL)
-
-        login_check_hbox = wx.BoxSizer(wx.HORIZONTAL)
-
-        nickName_label = wx.StaticText(panel, label="닉네임(Id)")
-
-        login_check_hbox.Add(nickName_label, flag=wx.LEFT, border=10)
-
-        login_check_hbox.AddStretchSpacer(1)
-
-        self.login_check = wx.CheckBox(panel, label="로그인하기")
-
-        self.login_check.Bind(wx.EVT_CHECKBOX, self.on_checkbox_toggle)
-
-        login_check_hbox.Add(self.login_check, flag=wx.RIGHT, border=10)
-
-        leftvbox.Add(login_check_hbox, proportion=0, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=0)
-
-        self.nickName_entry = wx.TextCtrl(panel)
-        leftvbox.Add(self.nickName_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
-
-        password_input_label = wx.StaticText(panel, label="비밀번호")
-        leftvbox.Add(password_input_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
-
-        self.password_input_entry = wx.TextCtrl(panel)
-        leftvbox.Add(self.password_input_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
-
-        title_input_label = wx.StaticText(panel, label="제목")
-        leftvbox.Add(title_input_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
-
-        self.title_input_entry = wx.TextCtrl(panel)
-        leftvbox.Add(self.title_input_entry, flag=wx.EXPAND | wx.LEFT | wx.RIGHT, border=10)
-
-        upload_btn = wx.Button(panel, label="이미지 업로드")
-        upload_btn.Bind(wx.EVT_BUTTON, self.upload_image)
+def create_chrome(headless=False, lean=False):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless=new')
+        options.add_argument('--window-size=1280,1024')
+    if lean:
+        options.page_load_strategy = 'eager'
+    driver = webdriver.Chrome(options=options)
+    if lean:
+        block_urls(driver, navigation=True)
+    return driver
+
+def load_blocklist(path=BLOCKLIST_PATH):
+    patterns = list(DEFAULT_BLOCKED_URLS)
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+    except OSError:
+        pass
+    return patterns
+
+def block_urls(driver, navigation):
+    # 크롬 DevTools 로 현재 탭에서만 막는다. 팝업 창은 별도 탭이라 영향을 받지 않는다
+    patterns = load_blocklist()
+    if navigation:
+        patterns += NAVIGATION_IMAGE_PATTERNS
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except (WebDriverException, AttributeError):
+        pass
+
+def is_driver_alive(driver):
+    # 브라우저가 죽었으면 세션 명령이 바로 실패한다
+    try:
+        driver.current_window_handle
+        return True
+    except WebDriverException:
+        return False
+
+def get_driver_memory_mb(driver):
+    # chromedriver 와 그 자식 프로세스(크롬)의 RSS 합계
+    if psutil is None:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except (psutil.Error, AttributeError):
+        return None
+
+class DriverPool:
+    def __init__(self, factory, max_posts=POOL_MAX_POSTS, max_memory_growth_mb=POOL_MAX_MEMORY_GROWTH_MB):
+        self.factory = factory
+        self.max_posts = max_posts
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.lock = threading.Lock()
+        self.idle = []
+        # driver -> {'posts': 올린 글 수, 'memory': 시작 시 메모리}
+        self.stats = {}
+        self.closed = False
+
+    def create(self):
+        driver = self.factory()
+        with self.lock:
+            if self.closed:
+                driver.quit()
+                raise WebDriverException("driver pool is closed")
+            self.stats[driver] = {'posts': 0, 'memory': get_driver_memory_mb(driver)}
+        return driver
+
+    def warm(self, count):
+        for _ in range(count):
+            with self.lock:
+                if self.closed or len(self.idle) >= count:
+                    return
+            try:
+                driver = self.create()
+            except WebDriverException:
+                return
+            with self.lock:
+                self.idle.append(driver)
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                driver = self.idle.pop() if self.idle else None
+            if driver is None:
+                return self.create()
+            if is_driver_alive(driver):
+                return driver
+            self.discard(driver)
+
+    def release(self, driver, posts=0):
+        with self.lock:
+            stats = self.stats.get(driver)
+            closed = self.closed
+        if stats is None:
+            return
+        stats['posts'] += posts
 
-        leftvbox.Add(upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        if closed or not is_driver_alive(driver) or self.needs_recycle(driver, stats):
+            self.discard(driver)
+            return
 
-        self.video_upload_btn = wx.Button(panel, label="비디오 업로드")
-        self.video_upload_btn.Bind(wx.EVT_BUTTON, self.upload_video)
-        self.video_upload_btn.Disable()
+        # 다음 실행에 로그인 상태가 남지 않도록 쿠키를 지운다
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException:
+            self.discard(driver)
+            return
+        with self.lock:
+            self.idle.append(driver)
+
+    def record_post(self, driver):
+        # 글을 하나 올릴 때마다 부른다. 긴 실행 중에도 바꿀 때가 되면 True
+        with self.lock:
+            stats = self.stats.get(driver)
+            if stats is None:
+                return False
+            stats['posts'] += 1
+        return self.needs_recycle(driver, stats)
+
+    def needs_recycle(self, driver, stats):
+        if stats['posts'] >= self.max_posts:
+            return True
+        memory = get_driver_memory_mb(driver)
+        if memory is not None and stats['memory'] is not None:
+            return memory - stats['memory'] > self.max_memory_growth_mb
+        return False
+
+    def discard(self, driver):
+        with self.lock:
+            self.stats.pop(driver, None)
+            if driver in self.idle:
+                self.idle.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def clear_idle(self):
+        with self.lock:
+            drivers = list(self.idle)
+        for driver in drivers:
+            self.discard(driver)
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            drivers = list(self.stats)
+        for driver in drivers:
+            self.discard(driver)
+
+def normalize_gallery_name(name):
+    name = unicodedata.normalize('NFKC', name)
+    return ''.join(name.split()).lower()
+
+class GalleryIndex:
+    def __init__(self, path=GALLERY_INDEX_PATH, ttl=GALLERY_INDEX_TTL, base_url=BASE_URL):
+        self.path = path
+        self.ttl = ttl
+        # 테스트 서버(DCPOST_BASE_URL)에서 모은 주소를 다른 사이트에 쓰지 않도록 같이 저장한다
+        self.base_url = base_url
+        self.updated_at = 0
+        # 정규화된 이름 -> 주소
+        self.links = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('base_url') != self.base_url:
+                raise ValueError("index for another site")
+            self.updated_at = data['updated_at']
+            self.links = data['links']
+        except (OSError, ValueError, KeyError):
+            self.updated_at = 0
+            self.links = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'base_url': self.base_url, 'updated_at': self.updated_at, 'links': self.links}, file,
+                      ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def is_fresh(self):
+        return bool(self.links) and time.time() - self.updated_at < self.ttl
+
+    def refresh(self, fetch_anchors):
+        # fetch_anchors(page) 는 페이지의 모든 갤러리 링크를 [이름, 주소] 목록으로 돌려준다
+        links = {}
+        for page in GALLERY_INDEX_PAGES:
+            try:
+                anchors = fetch_anchors(page)
+            except Exception:
+                continue
+            for name, href in anchors:
+                links.setdefault(normalize_gallery_name(name), href)
+        if links:
+            self.links = links
+            self.updated_at = time.time()
+            try:
+                self.save()
+            except OSError:
+                pass
+        return links
+
+    def resolve(self, fetch_anchors, names):
+        refreshed = False
+        if not self.is_fresh():
+            self.refresh(fetch_anchors)
+            refreshed = True
+
+        missing = [name for name in names if normalize_gallery_name(name) not in self.links]
+        if missing and not refreshed:
+            # 캐시에 없는 갤러리가 있으면 한 번만 다시 수집해본다
+            self.refresh(fetch_anchors)
+            missing = [name for name in names if normalize_gallery_name(name) not in self.links]
 
-        leftvbox.Add(self.video_upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        matching_links = {}
+        for name in names:
+            url = self.links.get(normalize_gallery_name(name))
+            if url is not None:
+                matching_links[name] = url
+        return matching_links, missing
+
+def fetch_driver_anchors(driver, page):
+    # 페이지마다 스크립트 한 번으로 모든 갤러리 링크를 모은다
+    driver.get(page)
+    return driver.execute_script(GALLERY_ANCHOR_SCRIPT) or []
+
+def group_file_items(file_items):
+    # 연속된 이미지는 팝업 한 번에 올리도록 묶는다. 순서는 목록 순서 그대로 유지
+    groups = []
+    for file_item in file_items:
+        if file_item.type == 'image' and groups and groups[-1][0] == 'image':
+            groups[-1][1].append(file_item)
+        else:
+            groups.append((file_item.type, [file_item]))
+    return groups
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class MediaCache:
+    # 한 번의 실행(캠페인) 동안 업로드한 미디어가 에디터에 남긴 내용을 파일 내용 해시로 기억한다
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hashes = {}
+        self.entries = {}
+
+    def key(self, file_items, mine_type):
+        hashes = []
+        for file_item in file_items:
+            stat = os.stat(file_item.path)
+            file_key = (file_item.path, stat.st_mtime, stat.st_size)
+            with self.lock:
+                file_hash = self.hashes.get(file_key)
+            if file_hash is None:
+                file_hash = hash_file(file_item.path)
+                with self.lock:
+                    self.hashes[file_key] = file_hash
+            hashes.append(file_hash)
+        return mine_type + ':' + '+'.join(hashes)
+
+    def get(self, key):
+        with self.lock:
+            return self.entries.get(key)
+
+    def put(self, key, html, inputs):
+        # 서버에 올라간 주소를 가리키는 경우만 다른 갤러리에서 다시 쓸 수 있다
+        if not re.search(r'src="https?://', html) or 'blob:' in html:
+            return False
+        with self.lock:
+            self.entries[key] = {'html': html, 'inputs': inputs}
+        return True
+
+def new_hidden_inputs(before, after):
+    # 업로드로 새로 생긴 hidden input 만 고른다. 값만 바뀐 기존 토큰은 제외
+    before_names = {name for name, _ in before}
+    remaining = list(before)
+    added = []
+    for pair in after:
+        if pair in remaining:
+            remaining.remove(pair)
+        elif pair[0] not in before_names or pair[0].endswith(']'):
+            added.append(pair)
+    return added
+
+class CookieStore:
+    # 로그인에 성공한 세션 쿠키를 계정별로 암호화해서 저장한다. 브라우저와 HTTP 엔진이 같은 형식을 쓴다
+    def __init__(self, directory=COOKIE_STORE_DIR):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.keys = {}
+
+    @property
+    def enabled(self):
+        return Fernet is not None
+
+    def path(self, account):
+        # 파일 이름에 아이디가 드러나지 않도록 해시를 쓴다
+        digest = hashlib.sha256(f"{BASE_URL}\n{account}".encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, digest + '.json')
+
+    def fernet(self, password, salt):
+        with self.lock:
+            key = self.keys.get((password, salt))
+            if key is None:
+                key = base64.urlsafe_b64encode(hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt,
+                                                                   COOKIE_KEY_ITERATIONS))
+                self.keys[(password, salt)] = key
+        return Fernet(key)
+
+    def load(self, account, password):
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path(account), 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            salt = base64.b64decode(data['salt'])
+            cookies = json.loads(self.fernet(password, salt).decrypt(data['token'].encode('ascii')))
+        except (OSError, ValueError, KeyError, InvalidToken):
+            return None
+        # 만료 시각이 지난 쿠키는 버린다
+        now = time.time()
+        cookies = [cookie for cookie in cookies if not cookie.get('expiry') or cookie['expiry'] > now]
+        return cookies or None
+
+    def save(self, account, password, cookies):
+        if not self.enabled or not cookies:
+            return
+        salt = os.urandom(16)
+        token = self.fernet(password, salt).encrypt(json.dumps(cookies).encode('utf-8'))
+        data = {'salt': base64.b64encode(salt).decode('ascii'), 'token': token.decode('ascii')}
+        path = self.path(account)
+        temp_path = path + '.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def discard(self, account):
+        try:
+            os.remove(self.path(account))
+        except OSError:
+            pass
+
+def optimize_image(path, cache_dir=IMAGE_CACHE_DIR, max_dimension=IMAGE_MAX_DIMENSION, quality=IMAGE_JPEG_QUALITY):
+    # 프로세스 풀에서 실행된다. 결과는 원본 내용 + 옵션 해시로 저장해서 같은 파일은 다시 처리하지 않는다
+    digest = hashlib.sha256(f"{max_dimension}:{quality}:".encode())
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    name = digest.hexdigest()
+
+    for ext in ('.jpg', '.png'):
+        cached_path = os.path.join(cache_dir, name + ext)
+        if os.path.exists(cached_path):
+            return cached_path
+
+    with Image.open(path) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # 투명도가 있는 PNG 만 PNG 로 두고 나머지는 JPEG 로 다시 압축한다. 메타데이터는 옮기지 않는다
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            cached_path = os.path.join(cache_dir, name + '.png')
+            tmp_path = cached_path + '.tmp'
+            image.save(tmp_path, 'PNG', optimize=True)
+        else:
+            cached_path = os.path.join(cache_dir, name + '.jpg')
+            tmp_path = cached_path + '.tmp'
+            image.convert('RGB').save(tmp_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+
+    # 원본보다 커지면 원본을 그대로 올린다
+    if os.path.getsize(tmp_path) >= os.path.getsize(path):
+        os.remove(tmp_path)
+        return path
+    os.replace(tmp_path, cached_path)
+    return cached_path
+
+# 한 번의 실행에서 글마다 똑같이 쓰이는 내용
+PostJob = namedtuple('PostJob', ['nickname', 'password', 'title', 'file_list',
+                                 'font_size', 'bold', 'center', 'login'])
+
+# 실행을 시작할 때 정해지는 설정. 실행 중에 화면 값이 바뀌어도 그대로다
+RunOptions = namedtuple('RunOptions', ['engine', 'workers', 'live_summary', 'lean_browser',
+                                       'pipeline_uploads', 'posts_per_minute'])
+
+def snapshot_job(job):
+    # 파일 항목은 화면에서 계속 바뀔 수 있으므로(최적화 결과 등) 시작할 때 값으로 복사해 둔다
+    return job._replace(file_list=tuple(item.copy() for item in job.file_list))
+
+class BrowserPoster:
+    # 셀레니움 드라이버로 글쓰기 화면을 직접 조작해서 글을 올린다 (GUI 없이도 쓸 수 있음)
+    def __init__(self, log=print, media_cache=None, run_timer=None, cookie_store=None, lean=False, pipeline=False,
+                 cancel=None):
+        self.log = log
+        self.media_cache = media_cache or MediaCache()
+        self.run_timer = run_timer or RunTimer()
+        self.cookie_store = cookie_store
+        self.lean = lean
+        # 설정되면 다음 단계로 넘어가기 전에 멈춘다 (threading.Event)
+        self.cancel = cancel
+        # 실제 사이트에서는 확인되지 않은 업로드 주소로 파일과 쿠키를 보내게 되므로 쓰지 않는다
+        self.pipeline = pipeline and requests is not None and USES_TEST_SERVER
+        self.uploader = None
+        self.upload_pool = None
+        if self.pipeline:
+            self.uploader = HttpPoster(media_cache=self.media_cache, run_timer=self.run_timer)
+            self.upload_pool = ThreadPoolExecutor(max_workers=UPLOAD_PIPELINE_WORKERS)
+        self.lock = threading.Lock()
+        self.probe_winners = {}
+
+    def probe(self, driver, key, candidates):
+        try:
+            name, elapsed = probe_selectors(driver, candidates)
+        except TimeoutException:
+            self.log(f"[ERROR] 선택자 {key}: 후보 {[name for name, _ in candidates]} 를 찾지 못했습니다")
+            raise
+        # 처음 찾았을 때와 구조가 바뀌었을 때만 기록한다
+        with self.lock:
+            changed = self.probe_winners.get(key) != name
+            self.probe_winners[key] = name
+        if changed:
+            self.log(f"선택자 {key}: {name} ({elapsed:.2f}초)")
+        return name
+
+    def login(self, driver, job):
+        try:
+            if job.login:
+                with self.run_timer.span('login'):
+                    if not self.restore_login(driver, job):
+                        self.submit_login_form(driver, job)
+                        if self.cookie_store is not None:
+                            self.cookie_store.save(job.nickname, job.password, driver.get_cookies())
+        except Exception:
+            self.log("[ERROR] 로그인에 실패하였습니다")
+            return False
+        return True
+
+    def restore_login(self, driver, job):
+        # 저장된 쿠키를 넣고 첫 화면을 한 번만 다시 열어 로그인 상태인지 본다
+        if self.cookie_store is None:
+            return False
+        cookies = self.cookie_store.load(job.nickname, job.password)
+        if not cookies:
+            return False
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException:
+                pass
+        driver.get(BASE_URL + "/")
+        if driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR):
+            return True
+        self.log("저장된 로그인이 만료되어 다시 로그인합니다")
+        self.cookie_store.discard(job.nickname)
+        for cookie in cookies:
+            driver.delete_cookie(cookie['name'])
+        return False
+
+    def submit_login_form(self, driver, job):
+        login_button_element = get_clickable_element_by_xpath(driver,
+                                                              '/html/body/div[2]/header/div/div[2]/ul/li[10]/a')
+        login_button_element.click()
+
+        login_id_input_element = get_element_by_xpath(driver,
+                                                      '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/div[1]/input[1]')
+
+        login_id_input_element.send_keys(job.nickname)
+
+        login_password_input_element = get_element_by_xpath(driver,
+                                                            '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/div[1]/input[2]')
+        login_password_input_element.send_keys(job.password)
+
+        login_submit_btn = get_clickable_element_by_xpath(driver,
+                                                          '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/button')
+        current_url = driver.current_url
+
+        login_submit_btn.click()
+        wait = WebDriverWait(driver, 3)
+        wait.until(EC.url_changes(current_url))
+
+    def open_gallery(self, driver, url):
+        if self.lean:
+            block_urls(driver, navigation=True)
+        driver.get(url)
+
+    def post_content(self, driver, job):
+
+        nickName = job.nickname
+        password = job.password
+        title = job.title
+        timer = self.run_timer
+        if self.lean:
+            # 글쓰기 화면부터는 에디터와 첨부 썸네일이 보이도록 이미지를 다시 받는다
+            block_urls(driver, navigation=False)
+        # 글쓰기 버튼
+        with timer.span('write_button'):
+            click_when_ready(driver, '/html/body/div[2]/div[3]/main/section[1]/article[2]/div[3]/div[2]/button')
+        check_cancel(self.cancel)
 
-        load_btn = wx.Button(panel, label="txt 파일 업로드")
-        load_btn.Bind(wx.EVT_BUTTON, self.load_file)
+        groups = group_file_items(job.file_list)
+        uploads, upload_session = {}, None
+        with timer.span('form_fill'):
+            layout = self.probe(driver, 'write_form', WRITE_FORM_LAYOUTS)
+            if self.pipeline:
+                # 에디터가 준비되면 첨부 파일부터 올리기 시작한다
+                uploads, upload_session = self.start_uploads(driver, groups)
+            if layout == 'anonymous':
+                gall_nick_name_element = get_element_by_xpath(driver,'/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/input[1]')
+                # input 태그의 value 속성 값 가져오기
+                input_value = gall_nick_name_element.get_attribute("value")
+                # 값이 있다면 btn_gall_nick_name_x 클릭
 
-        leftvbox.Add(load_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+                if input_value.strip():  # 값이 비어있지 않은 경우
+                    btn_element = WebDriverWait(driver, 10).until(
+                        EC.element_to_be_clickable(
+                            (By.XPATH, '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/button[1]'))
+                    )
+                    btn_element.click()
 
-        # 이미지 목록 박스 추가
-        self.file_listbox = wx.ListBox(panel)
-        leftvbox.Add(self.file_listbox, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+                nick_name_element = get_element_by_xpath(driver,
+                                                         '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/input[2]')
 
-        image_list_hbox = wx.BoxSizer(wx.HORIZONTAL)
+                nick_name_element.send_keys(nickName)
 
-        self.up_button = wx.Button(panel, label="Up")
-        self.down_button = wx.Button(panel, label="Down")
-        self.delete_button = wx.Button(panel, label="Delete")
+                password_element = get_element_by_xpath(driver,
+                                                        '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[2]/input')
 
-        self.up_button.Bind(wx.EVT_BUTTON, self.on_move_up)
-        self.down_button.Bind(wx.EVT_BUTTON, self.on_move_down)
-        self.delete_button.Bind(wx.EVT_BUTTON, self.on_delete_selected)
+                password_element.send_keys(password)
 
-        image_list_hbox.Add(self.up_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
-        image_list_hbox.Add(self.down_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
-        image_list_hbox.Add(self.delete_button, proportion=1, flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=3)
+                title_element = get_element_by_xpath(driver, '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[3]/input')
 
-        leftvbox.Add(image_list_hbox, proportion=0, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+                title_element.send_keys(title)
 
-        left_header_hbox = wx.BoxSizer(wx.HORIZONTAL)
+            else:
+               login_title_element = get_element_by_xpath(driver, '//*[@id="subject"]')
+               login_title_element.send_keys(title)
+            #xpath update
+            font_weight_element_xpath = LAYOUT_XPATHS[layout]['font_weight']
+            font_size_list_element_xpath = LAYOUT_XPATHS[layout]['font_size_list']
+            apply_button_xpath = LAYOUT_XPATHS[layout]['apply_button']
 
-        self.center_checkbox = wx.CheckBox(panel, label="중앙 정렬")
-        left_header_hbox.Add(self.center_checkbox, proportion=1,
-                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        # 이미지 업로드
+        try:
+            check_cancel(self.cancel)
+            start = time.perf_counter()
+            changed = self.apply_toolbar_format(driver, job, font_weight_element_xpath, font_size_list_element_xpath)
+            timer.record('font_toolbar', time.perf_counter() - start, changed)
+
+            for index, (file_type, file_items) in enumerate(groups):
+                check_cancel(self.cancel)
+                if index in uploads:
+                    self.insert_slot(driver, index)
+                elif file_type == "image":
+                    with timer.span('upload_images', describe_items(file_items)):
+                        self.upload_media(driver, file_items, 'image')
+                elif file_type == "text":
+                    with timer.span('upload_text', describe_items(file_items)):
+                        self.upload_web_texts(driver, file_items[0].content, job.bold, job.font_size)
+                elif file_type == "video":
+                    with timer.span('upload_video', describe_items(file_items)):
+                        self.upload_media(driver, file_items, 'video')
+                else:
+                    self.log(f"알 수 없는 파일 유형: {file_items[0].path}")
 
-        self.font_weight_checkbox = wx.CheckBox(panel, label="굵게 쓰기")
-        left_header_hbox.Add(self.font_weight_checkbox, proportion=1,
-                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+            if uploads:
+                self.fill_slots(driver, groups, uploads)
+        finally:
+            # 취소나 오류로 중간에 끝나도 미리 올리던 세션은 닫는다
+            if upload_session is not None:
+                upload_session.close()
 
-        font_size_label = wx.StaticText(panel, label="글자 크기:")
-        left_header_hbox.Add(font_size_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        #포스팅 내용
+        if job.center:
+            start = time.perf_counter()
+            counts = self.center_content(driver)
+            timer.record('center', time.perf_counter() - start,
+                         f"이미지 {counts['images']}, 동영상 {counts['videos']}, 문단 {counts['paragraphs']}")
 
-        self.sample_choice = wx.Choice(panel,
-                                       choices=["8px", "9px", "10px", "11px", "12px", "14px", "18px", "24px", "36px"])
-        left_header_hbox.Add(self.sample_choice, proportion=1,
-                             flag=wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        # time.sleep(50)
 
-        leftvbox.Add(left_header_hbox, proportion=0, flag=wx.EXPAND | wx.ALL, border=10)
+        check_cancel(self.cancel)
+        # 자동입력 방지 코드를 요구하면 지금은 올릴 수 없으니 속도를 낮추고 나중에 다시 시도한다
+        if driver.find_elements(By.CSS_SELECTOR, CAPTCHA_SELECTOR):
+            raise ThrottledError("captcha")
+
+        with timer.span('submit'):
+            apply_button = get_element_by_xpath(driver, apply_button_xpath)
+            current_url = driver.current_url
+            apply_button.click()
+            return wait_for_submit(driver, current_url)
+
+    def close(self):
+        if self.upload_pool is not None:
+            self.upload_pool.shutdown(wait=False, cancel_futures=True)
+            self.uploader.close()
+
+    def upload_session(self, driver, context):
+        # 브라우저의 쿠키와 User-Agent 를 그대로 쓰는 세션
+        session = requests.Session()
+        session.headers.update({'User-Agent': context['user_agent'], 'Referer': context['url']})
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                path=cookie.get('path', '/'))
+        return session
+
+    def start_uploads(self, driver, groups):
+        # 자리 번호(묶음 순서) -> 업로드 결과를 돌려주는 future 또는 캐시 항목
+        media = [(index, file_type, file_items) for index, (file_type, file_items) in enumerate(groups)
+                 if file_type in ('image', 'video')]
+        if not media:
+            return {}, None
+        try:
+            context = driver.execute_script(UPLOAD_CONTEXT_SCRIPT)
+            session = self.upload_session(driver, context)
+        except WebDriverException:
+            return {}, None
+        form_fields = dict(context['inputs'])
+        gallery_id = form_fields.get('id') or parse_qs(urlparse(context['url']).query).get('id', [''])[0]
+
+        uploads = {}
+        for index, file_type, file_items in media:
+            try:
+                key = self.media_cache.key(file_items, file_type)
+            except OSError:
+                continue
+            entry = self.media_cache.get(key)
+            if entry:
+                uploads[index] = entry
+                continue
+            uploads[index] = self.upload_pool.submit(self.uploader.upload_media, session, form_fields, gallery_id,
+                                                     file_items, file_type)
+        return uploads, session
+
+    def insert_slot(self, driver, index):
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        try:
+            driver.execute_script(INSERT_SLOT_SCRIPT, index)
+        finally:
+            driver.switch_to.default_content()
+
+    def fill_slots(self, driver, groups, uploads):
+        filled = []
+        inputs = []
+        failed = []
+        for index, upload in sorted(uploads.items()):
+            file_type, file_items = groups[index]
+            if isinstance(upload, dict):
+                if upload['html']:
+                    filled.append([index, upload['html']])
+                    inputs += upload['inputs']
+                else:
+                    failed.append(index)
+                continue
+            if file_type == 'video':
+                timeout = VIDEO_UPLOAD_TIMEOUT
+            else:
+                timeout = IMAGE_UPLOAD_TIMEOUT + IMAGE_UPLOAD_TIMEOUT_PER_FILE * (len(file_items) - 1)
+            # 본문을 쓰는 동안 끝나지 않은 업로드만 여기서 기다린다
+            with self.run_timer.span('upload_wait', describe_items(file_items)):
+                try:
+                    html = upload.result(timeout=timeout)
+                    if not html:
+                        raise ValueError("empty upload")
+                    filled.append([index, html])
+                except Exception as e:
+                    self.log(f"미리 올리기 실패, 팝업으로 다시 올립니다: {describe_items(file_items)} ({e!r})")
+                    failed.append(index)
+
+        if inputs:
+            driver.execute_script(ADD_HIDDEN_INPUTS_SCRIPT, inputs)
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        try:
+            failed += driver.execute_script(FILL_SLOTS_SCRIPT, filled)
+        finally:
+            driver.switch_to.default_content()
 
-        upload_btn = wx.Button(panel, label="글 업로드")
-        upload_btn.Bind(wx.EVT_BUTTON, self.upload_content)
-        leftvbox.Add(upload_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        for index in sorted(failed):
+            file_type, file_items = groups[index]
+            self.upload_to_slot(driver, index, file_items, file_type)
 
-        self.text_widget = wx.TextCtrl(panel, style=wx.TE_MULTILINE)
-        leftvbox.Add(self.text_widget,  proportion=1, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+    def upload_to_slot(self, driver, index, file_items, mine_type):
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        driver.execute_script(SNAPSHOT_EDITOR_SCRIPT)
+        driver.switch_to.default_content()
 
-        self.run_btn = wx.Button(panel, label="실행")
-        self.run_btn.Bind(wx.EVT_BUTTON, self.run_thread)
-        rightvbox.Add(self.run_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        span = 'upload_images' if mine_type == 'image' else 'upload_video'
+        with self.run_timer.span(span, describe_items(file_items)):
+            self.upload_web_images(driver, file_items, mine_type)
 
-        #갤러라 목록 업로드
-        url_load_btn = wx.Button(panel, label="갤러리 목록 업로드(.txt)")
-        url_load_btn.Bind(wx.EVT_BUTTON, self.on_load)
-        rightvbox.Add(url_load_btn, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        try:
+            moved = driver.execute_script(MOVE_TO_SLOT_SCRIPT, index)
+        finally:
+            driver.switch_to.default_content()
+        if not moved:
+            # 자리가 없으면 첨부가 글 끝에 붙어 순서가 어긋나므로 이 갤러리는 다시 시도한다
+            self.log(f"[ERROR] 첨부 자리 {index} 를 찾지 못했습니다: {describe_items(file_items)}")
+            raise RuntimeError(f"missing upload slot {index}")
+
+    def apply_toolbar_format(self, driver, job, bold_xpath, size_list_xpath):
+        # 툴바 버튼을 스크립트 한 번으로 누른다. 아직 툴바가 없으면 기다렸다가 하나씩 누른다
+        size_xpath = None
+        if job.font_size in FONT_SIZES:
+            size_xpath = FONT_SIZE_XPATH.format(index=FONT_SIZES.index(job.font_size) + 1)
+        if not job.bold and not size_xpath:
+            return ''
+        result = driver.execute_script(TOOLBAR_FORMAT_SCRIPT, bold_xpath if job.bold else None,
+                                       size_list_xpath, size_xpath)
+        if job.bold and not result['bold']:
+            get_element_by_xpath(driver, bold_xpath).click()
+            result['bold'] = 1
+        if size_xpath and not result['font_size']:
+            if 'font_size_list' in result['missing']:
+                get_element_by_xpath(driver, size_list_xpath).click()
+            get_element_by_xpath(driver, size_xpath).click()
+            result['font_size'] = 1
+        changed = []
+        if result['bold']:
+            changed.append('굵게')
+        if result['font_size']:
+            changed.append(job.font_size)
+        return ', '.join(changed)
+
+    def center_content(self, driver):
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        try:
+            return driver.execute_script(CENTER_CONTENT_SCRIPT, VIDEO_THUMB_SELECTOR)
+        finally:
+            driver.switch_to.default_content()
 
-        self.url_text_widget = wx.TextCtrl(panel, style=wx.TE_MULTILINE)
-        rightvbox.Add(self.url_text_widget, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+    def upload_web_texts(self, driver, content, bold=False, font_size=''):
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        content_element = get_element_by_xpath(driver, '/html/body')
 
-        log_label = wx.StaticText(panel, label="작업 기록")
-        rightvbox.Add(log_label, flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
-        self.log_text_widget = rt.RichTextCtrl(panel, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        rightvbox.Add(self.log_text_widget,  proportion=1,flag=wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, border=10)
+        inserted = False
+        if FAST_TEXT_INSERT:
+            try:
+                inserted = driver.execute_script(INSERT_TEXT_SCRIPT, content, bold, font_size)
+            except WebDriverException:
+                inserted = False
+        if not inserted:
+            content_element.send_keys(content)
 
-        hbox.Add(leftvbox, proportion=1, flag=wx.EXPAND | wx.ALL, border=10)
-        hbox.Add(rightvbox, proportion=1, flag=wx.EXPAND | wx.ALL, border=10)
+        driver.switch_to.default_content()
 
-        self.nickName_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
-        self.password_input_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
-        self.title_input_entry.Bind(wx.EVT_TEXT, self.on_text_changed)
-        self.text_widget.Bind(wx.EVT_TEXT, self.on_text_changed)
-        self.url_text_widget.Bind(wx.EVT_TEXT, self.on_text_changed)
-        self.on_text_changed(None)
+    def upload_media(self, driver, file_items, mine_type):
+        media_cache = self.media_cache
+        try:
+            key = media_cache.key(file_items, mine_type)
+        except OSError:
+            key = None
 
-        panel.SetSizer(hbox)
+        entry = media_cache.get(key) if key else None
+        if entry:
+            try:
+                self.insert_cached_media(driver, entry)
+                return
+            except WebDriverException:
+                driver.switch_to.default_content()
 
-    def add_file(self, path):
-        file_item = FileItem(path=path)
-        self.file_list.append(file_item)
+        if not key:
+            self.upload_web_images(driver, file_items, mine_type)
+            return
 
-    def add_txt_file(self, content):
-        file_item = FileItem(content=content)
-        self.file_list.append(file_item)
+        inputs_before = driver.execute_script(HIDDEN_INPUTS_SCRIPT)
+        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+        driver.switch_to.frame(iframe)
+        driver.execute_script(SNAPSHOT_EDITOR_SCRIPT)
+        driver.switch_to.default_content()
 
-    def append_log(self, message):
-        if '[ERROR]' in message:
-            color = wx.RED
-        elif '[SUCCESS]' in message:
-            color = wx.GREEN
-        else:
-            color = wx.SystemSettings.GetColour(wx.SYS_COLOUR_WINDOWTEXT)
-        current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        self.log_text_widget.BeginTextColour(color)  # 텍스트 색상 시작
-        self.log_text_widget.WriteText("[" + current_time + "]"+ message + "\n")
-        self.log_text_widget.EndTextColour()  # 텍스트 색상 종료
-        self.log_text_widget.ShowPosition(self.log_text_widget.GetLastPosition())
+        self.upload_web_images(driver, file_items, mine_type)
 
-    def upload_web_texts(self, driver, content):
+        try:
+            inputs_after = driver.execute_script(HIDDEN_INPUTS_SCRIPT)
+            iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
+            driver.switch_to.frame(iframe)
+            html = driver.execute_script(COLLECT_EDITOR_SCRIPT) or ''
+        finally:
+            driver.switch_to.default_content()
+        media_cache.put(key, html, new_hidden_inputs(inputs_before, inputs_after))
+
+    def insert_cached_media(self, driver, entry):
+        if entry['inputs']:
+            driver.execute_script(ADD_HIDDEN_INPUTS_SCRIPT, entry['inputs'])
         iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
         driver.switch_to.frame(iframe)
-        content_element = get_element_by_xpath(driver, '/html/body')
-        content_element.send_keys(content)
-
+        driver.execute_script(INSERT_MEDIA_SCRIPT, entry['html'])
         driver.switch_to.default_content()
 
-    def upload_web_images(self, driver, file_item, mine_type):
+    def upload_web_images(self, driver, file_items, mine_type):
         # "사진" 링크를 클릭
-        popup_url = "https://gall.dcinside.com/upload/image"
+        popup_url = BASE_URL + "/upload/image"
         apply_xpath = '/html/body/div[1]/div/div[2]/button'
 
+        # self.file_list 내의 이미지 경로만 추출
+        file_paths = [file_item.upload_path for file_item in file_items if file_item.upload_path]
+        if not file_paths:
+            self.log("올릴 파일이 없습니다")
+            return
+
         if mine_type == 'image':
-            print('print')
             photo_link = get_element_by_xpath(driver, '//*[@id="tx_image"]/a')
             photo_link.click()
-            print('print2')
 
         elif mine_type == 'video':
             vidio_link = get_element_by_xpath(driver, '//*[@id="tx_movie"]/a')
             vidio_link.click()
-            popup_url = "https://gall.dcinside.com/upload/movie"
+            popup_url = BASE_URL + "/upload/movie"
             apply_xpath = '//*[@id="movie_tmp"]/div/div[3]/button'
 
         # 팝업 창으로 전환
@@ -235,22 +1426,30 @@ class PostApp(wx.Frame):
             if driver.current_url == popup_url:
                 break
 
-        # self.file_list 내의 이미지 경로만 추출
-        file_path = file_item.path
-        if not file_path:
-            print("No File to upload.")
-            return
         file_input = driver.find_element(By.XPATH, '//input[@type="file"]')
 
-        file_input.send_keys(file_path)
-
         try:
             if mine_type == 'video':
-                get_element_by_xpath(driver, '//*[@id="movie_tmp"]/div/div[2]/div[1]/div[1]/img', timeout=50)
+                file_input.send_keys(file_paths[0])
+                get_element_by_xpath(driver, '//*[@id="movie_tmp"]/div/div[2]/div[1]/div[1]/img',
+                                     timeout=VIDEO_UPLOAD_TIMEOUT)
             elif mine_type == 'image':
-                get_element_by_xpath(driver, '//*[@id="sortable"]/li[1]/img', timeout=10)
+                timeout = IMAGE_UPLOAD_TIMEOUT + IMAGE_UPLOAD_TIMEOUT_PER_FILE * (len(file_paths) - 1)
+                if file_input.get_attribute('multiple'):
+                    # 여러 파일을 한 번에 넣으면 선택한 순서대로 썸네일이 붙는다
+                    file_input.send_keys('\n'.join(file_paths))
+                    wait_for_thumbnails(driver, len(file_paths), timeout)
+                else:
+                    # 한 장씩만 받는 경우에도 팝업은 한 번만 열고 순서대로 올린다
+                    for index, file_path in enumerate(file_paths, start=1):
+                        driver.find_element(By.XPATH, '//input[@type="file"]').send_keys(file_path)
+                        wait_for_thumbnails(driver, index, IMAGE_UPLOAD_TIMEOUT)
         except:
-            wx.CallAfter(self.append_log, '파일 업로드 실패')
+            # 첨부 없이 등록하지 않도록 팝업을 닫고 이 갤러리를 실패(재시도)로 넘긴다
+            self.log('파일 업로드 실패')
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            raise
 
         apply_element = get_element_by_xpath(driver, apply_xpath)
 
@@ -259,308 +1458,1384 @@ class PostApp(wx.Frame):
         # 원래의 메인 창으로 다시 전환
         driver.switch_to.window(driver.window_handles[0])
 
-    def on_text_changed(self, event):
-        # 필요한 값 입력 확인
-        if (self.nickName_entry.GetValue().strip() and
-                self.password_input_entry.GetValue().strip() and
-                self.title_input_entry.GetValue().strip() and
-                self.url_text_widget.GetValue().strip() and
-                len(self.url_text_widget.GetValue().split('\n')) > 0):
-            self.run_btn.Enable()  # Run 버튼 활성화
-        else:
-            self.run_btn.Disable()  # Run 버튼 비활성화
-
-    def on_checkbox_toggle(self, event):
-        if self.login_check.IsChecked():
-            self.video_upload_btn.Enable()
-        else:
-            self.video_upload_btn.Disable()
-
-    def post_content(self, driver):
-
-        nickName = self.nickName_entry.GetValue()
-        password = self.password_input_entry.GetValue()
-        title = self.title_input_entry.GetValue()
-        content = self.text_widget.GetValue()
-        font_weight_element_xpath = "/html/body/div[2]/main/section/article[2]/form/div[3]/div/div[2]/div/ul[3]/li[1]/div/a"
-        font_size_list_element_xpath = "/html/body/div[2]/main/section/article[2]/form/div[3]/div/div[2]/div/ul[2]/li/div[1]/a"
-        apply_button_xpath = '//*[@id="write"]/div[5]/button[2]'
-        # 글쓰기 버튼
-        element = get_clickable_element_by_xpath(driver, '/html/body/div[2]/div[3]/main/section[1]/article[2]/div[3]/div[2]/button')
-        # 요소 클릭
+class PageParser(HTMLParser):
+    # 글쓰기 폼의 input 값과 갤러리 링크를 모은다
+    def __init__(self, form_id='write'):
+        super().__init__()
+        self.form_id = form_id
+        self.in_form = False
+        self.form_fields = {}
+        self.anchors = []
+        self.anchor_href = None
+        self.anchor_text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form' and attrs.get('id') == self.form_id:
+            self.in_form = True
+        elif tag == 'input' and self.in_form and attrs.get('name'):
+            if attrs.get('type', 'text') in ('hidden', 'text', 'password'):
+                self.form_fields[attrs['name']] = attrs.get('value') or ''
+        elif tag == 'a' and 'board/lists' in (attrs.get('href') or ''):
+            self.anchor_href = attrs['href']
+            self.anchor_text = []
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self.in_form = False
+        elif tag == 'a' and self.anchor_href is not None:
+            name = ''.join(self.anchor_text).strip()
+            if name:
+                self.anchors.append([name, self.anchor_href])
+            self.anchor_href = None
+
+    def handle_data(self, data):
+        if self.anchor_href is not None:
+            self.anchor_text.append(data)
+
+def escape_html(text):
+    return (text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('"', '&quot;'))
+
+class HttpPoster:
+    # 브라우저 없이 글쓰기 폼과 업로드를 HTTP 로 직접 보낸다. 세션은 워커끼리 돌려 쓴다
+    def __init__(self, base_url=BASE_URL, endpoints=HTTP_ENDPOINTS, pool_size=MAX_WORKERS, media_cache=None,
+                 run_timer=None, cookie_store=None, cancel=None):
+        self.base_url = base_url.rstrip('/')
+        self.endpoints = endpoints
+        self.pool_size = pool_size
+        self.media_cache = media_cache or MediaCache()
+        self.run_timer = run_timer or RunTimer()
+        self.cookie_store = cookie_store
+        self.cancel = cancel
+        self.sessions = queue.LifoQueue()
+        self.all_sessions = []
+        self.lock = threading.Lock()
+
+    def create_session(self):
+        session = requests.Session()
+        # keep-alive 연결을 워커 수만큼 유지
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': HTTP_USER_AGENT, 'Referer': self.base_url + '/'})
+        with self.lock:
+            self.all_sessions.append(session)
+        return session
+
+    @contextmanager
+    def session(self):
         try:
-            time.sleep(1)
-            element.click()
-        except Exception as e:
-            print(f"Error during click: {e}")
-
-        if not self.login_check.IsChecked():
-            gall_nick_name_element = get_element_by_xpath(driver,'/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/input[1]')
-            # input 태그의 value 속성 값 가져오기
-            input_value = gall_nick_name_element.get_attribute("value")
-            # 값이 있다면 btn_gall_nick_name_x 클릭
-
-            if input_value.strip():  # 값이 비어있지 않은 경우
-                btn_element = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/button[1]'))
-                )
-                btn_element.click()
-
-            nick_name_element = get_element_by_xpath(driver,
-                                                     '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[1]/input[2]')
-
-            nick_name_element.send_keys(nickName)
-
-            password_element = get_element_by_xpath(driver,
-                                                    '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[2]/input')
-
-            password_element.send_keys(password)
-
-            title_element = get_element_by_xpath(driver, '/html/body/div[2]/main/section/article[2]/form/div[1]/fieldset/div[3]/input')
-
-            title_element.send_keys(title)
-
-        else:
-           login_title_element = get_element_by_xpath(driver, '//*[@id="subject"]')
-           login_title_element.send_keys(title)
-           #xpath update
-           font_weight_element_xpath = "/html/body/div[2]/main/section/article[2]/form/div[4]/div/div[2]/div/ul[3]/li[1]/div/a"
-           font_size_list_element_xpath = "/html/body/div[2]/main/section/article[2]/form/div[4]/div/div[2]/div/ul[2]/li/div[1]/a"
-           apply_button_xpath = "/html/body/div[2]/main/section/article[2]/form/div[6]/button[2]"
+            session = self.sessions.get_nowait()
+        except queue.Empty:
+            session = self.create_session()
+        try:
+            yield session
+        finally:
+            self.sessions.put(session)
+
+    def close(self):
+        with self.lock:
+            sessions, self.all_sessions = self.all_sessions, []
+        for session in sessions:
+            session.close()
+
+    def url(self, name, **kwargs):
+        return urljoin(self.base_url + '/', self.endpoints[name].format(**kwargs))
+
+    def fetch_gallery_anchors(self, page):
+        with self.session() as session:
+            response = session.get(page, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        parser = PageParser()
+        parser.feed(response.text)
+        return [[name, urljoin(page, href)] for name, href in parser.anchors]
+
+    def login(self, session, job):
+        if self.restore_login(session, job):
+            return
+        self.submit_login(session, job)
+        if self.cookie_store is not None:
+            cookies = []
+            for cookie in session.cookies:
+                data = {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path,
+                        'secure': bool(cookie.secure)}
+                if cookie.expires:
+                    data['expiry'] = cookie.expires
+                cookies.append(data)
+            self.cookie_store.save(job.nickname, job.password, cookies)
+
+    def restore_login(self, session, job):
+        if self.cookie_store is None:
+            return False
+        cookies = self.cookie_store.load(job.nickname, job.password)
+        if not cookies:
+            return False
+        for cookie in cookies:
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                path=cookie.get('path', '/'))
+        response = session.get(self.base_url + '/', timeout=HTTP_TIMEOUT)
+        if response.ok and LOGGED_IN_PATTERN.search(response.text):
+            return True
+        self.cookie_store.discard(job.nickname)
+        session.cookies.clear()
+        return False
+
+    def submit_login(self, session, job):
+        response = session.post(self.url('login'),
+                                data={'user_id': job.nickname, 'pw': job.password},
+                                timeout=HTTP_TIMEOUT)
+        if response.status_code in THROTTLE_STATUS_CODES:
+            raise ThrottledError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+        if response.text.startswith('false'):
+            raise submit_error(response.text.partition('||')[2] or 'login failed')
+
+    def gallery_target(self, gallery_url):
+        parsed = urlparse(gallery_url)
+        gallery_id = parse_qs(parsed.query).get('id', [''])[0]
+        # /board/lists, /mgallery/board/lists 처럼 목록 주소에서 게시판 경로를 얻는다
+        board = parsed.path.rstrip('/').rsplit('/lists', 1)[0] or '/board'
+        return board, gallery_id
+
+    def upload_media(self, session, form_fields, gallery_id, file_items, mine_type):
+        key = None
+        try:
+            key = self.media_cache.key(file_items, mine_type)
+        except OSError:
+            pass
+        entry = self.media_cache.get(key) if key else None
+        if entry:
+            return entry['html']
+
+        endpoint = 'image_upload' if mine_type == 'image' else 'movie_upload'
+        files = []
+        handles = []
+        try:
+            for file_item in file_items:
+                handle = open(file_item.upload_path, 'rb')
+                handles.append(handle)
+                files.append(('files[]', (os.path.basename(file_item.upload_path), handle)))
+            response = session.post(self.url(endpoint, gallery_id=gallery_id),
+                                    data=form_fields, files=files, timeout=HTTP_TIMEOUT * 4)
+        finally:
+            for handle in handles:
+                handle.close()
+        response.raise_for_status()
+
+        html = ''
+        for uploaded in response.json().get('files', []):
+            url = uploaded.get('web__url') or uploaded.get('url')
+            if mine_type == 'image':
+                html += f'<p><img src="{escape_html(url)}" class="txc-image" style="clear:none;float:none;"></p>'
+            else:
+                html += (f'<p><iframe src="{escape_html(url)}" class="video_inbox dc_movie_thumbox" '
+                         f'frameborder="0" allowfullscreen></iframe></p>')
+        if not html:
+            # 200 이어도 올라간 파일이 없으면 첨부 없이 등록되지 않도록 실패로 본다
+            raise ValueError(f"업로드 응답에 파일이 없습니다: {describe_items(file_items)}")
+        if key:
+            self.media_cache.put(key, html, [])
+        return html
+
+    def build_memo(self, job, parts):
+        style = []
+        if job.font_size:
+            style.append(f"font-size:{job.font_size}")
+        if job.center:
+            style.append("text-align:center")
+        style = ';'.join(style)
+
+        memo = ''
+        for part in parts:
+            if isinstance(part, FileItem):
+                for line in part.content.splitlines() or ['']:
+                    text = escape_html(line) or '<br>'
+                    if job.bold and line:
+                        text = f'<b>{text}</b>'
+                    memo += f'<p style="{style}">{text}</p>' if style else f'<p>{text}</p>'
+            elif job.center:
+                memo += part.replace('<p>', '<p style="text-align:center">')
+            else:
+                memo += part
+        return memo
+
+    def post_content(self, session, job, gallery_url):
+        board, gallery_id = self.gallery_target(gallery_url)
+
+        with self.run_timer.span('write_form'):
+            response = session.get(self.url('write', board=board, gallery_id=gallery_id), timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            parser = PageParser()
+            parser.feed(response.text)
+            form_fields = parser.form_fields
+
+        parts = []
+        for file_type, file_items in group_file_items(job.file_list):
+            check_cancel(self.cancel)
+            if file_type == 'text':
+                parts.append(file_items[0])
+            elif file_type in ('image', 'video'):
+                with self.run_timer.span('upload_images' if file_type == 'image' else 'upload_video',
+                                         describe_items(file_items)):
+                    parts.append(self.upload_media(session, form_fields, gallery_id, file_items, file_type))
+
+        data = dict(form_fields)
+        data.update({'subject': job.title, 'memo': self.build_memo(job, parts)})
+        if not job.login:
+            data.update({'name': job.nickname, 'password': job.password})
+
+        check_cancel(self.cancel)
+        start = time.monotonic()
+        response = session.post(self.url('submit', board=board, gallery_id=gallery_id),
+                                data=data, timeout=HTTP_TIMEOUT)
+        latency = time.monotonic() - start
+        self.run_timer.record('submit', latency)
+        if response.status_code in THROTTLE_STATUS_CODES:
+            raise ThrottledError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+        # 성공: "true||글번호", 실패: "false||사유"
+        if not response.text.startswith('true'):
+            raise submit_error(response.text.partition('||')[2] or response.text[:100])
+        return 'http', latency
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # nearest-rank
+    index = min(len(ordered) - 1, max(0, math.ceil(ratio * len(ordered)) - 1))
+    return ordered[index]
+
+class RunTimer:
+    # 실행 중 단계별 소요 시간을 모은다. 갤러리 이름은 스레드별로 따라간다
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.spans = []
+        self.started_at = time.time()
+
+    @contextmanager
+    def gallery(self, name):
+        previous = getattr(self.local, 'gallery', None)
+        self.local.gallery = name
+        try:
+            yield
+        finally:
+            self.local.gallery = previous
 
-        # 이미지 업로드
-        if self.font_weight_checkbox.IsChecked():
-            font_weight_element = get_element_by_xpath(driver, font_weight_element_xpath)
-            font_weight_element.click()
-
-        font_size_list_element = get_element_by_xpath(driver, font_size_list_element_xpath)
-        font_size_list_element.click()
-
-        selected_size = self.sample_choice.GetStringSelection()
-
-        size_to_xpath = {
-            '8px': '//*[@id="tx_fontsize_menu"]/ul/li[1]/a',
-            '9px': '//*[@id="tx_fontsize_menu"]/ul/li[2]/a',
-            '10px': '//*[@id="tx_fontsize_menu"]/ul/li[3]/a',
-            '11px': '//*[@id="tx_fontsize_menu"]/ul/li[4]/a',
-            '12px': '//*[@id="tx_fontsize_menu"]/ul/li[5]/a',
-            '14px': '//*[@id="tx_fontsize_menu"]/ul/li[6]/a',
-            '18px': '//*[@id="tx_fontsize_menu"]/ul/li[7]/a',
-            '24px': '//*[@id="tx_fontsize_menu"]/ul/li[8]/a',
-            '36px': '//*[@id="tx_fontsize_menu"]/ul/li[9]/a'
+    @contextmanager
+    def span(self, stage, item=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, item)
+
+    def record(self, stage, seconds, item=None):
+        span = {'stage': stage, 'seconds': seconds, 'gallery': getattr(self.local, 'gallery', None), 'item': item}
+        with self.lock:
+            self.spans.append(span)
+
+    def stages(self):
+        with self.lock:
+            spans = list(self.spans)
+        durations = defaultdict(list)
+        for span in spans:
+            durations[span['stage']].append(span['seconds'])
+        return {stage: {'count': len(values),
+                        'total': sum(values),
+                        'p50': percentile(values, 0.5),
+                        'p95': percentile(values, 0.95),
+                        'max': max(values)}
+                for stage, values in durations.items()}
+
+    def summary(self, limit=4):
+        stages = sorted(self.stages().items(), key=lambda pair: pair[1]['total'], reverse=True)[:limit]
+        return ' | '.join(f"{stage} p50 {stats['p50']:.2f}s p95 {stats['p95']:.2f}s" for stage, stats in stages)
+
+    def report(self):
+        with self.lock:
+            spans = list(self.spans)
+        galleries = defaultdict(lambda: {'seconds': 0.0, 'stages': defaultdict(float)})
+        for span in spans:
+            if span['gallery'] is None:
+                continue
+            gallery = galleries[span['gallery']]
+            gallery['stages'][span['stage']] += span['seconds']
+            if span['stage'] == 'post':
+                gallery['seconds'] += span['seconds']
+        slowest = sorted(galleries.items(), key=lambda pair: pair[1]['seconds'], reverse=True)
+        return {
+            'started_at': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+            'elapsed': time.time() - self.started_at,
+            'stages': self.stages(),
+            'slowest_galleries': [{'gallery': name, 'seconds': data['seconds'], 'stages': dict(data['stages'])}
+                                  for name, data in slowest[:REPORT_SLOWEST_GALLERIES]],
+            'spans': spans,
         }
 
-        if selected_size:
-            font_size_element = get_element_by_xpath(driver, size_to_xpath[selected_size])
-            font_size_element.click()
-
-        if len(self.file_list) > 0:
-            for file_item in self.file_list:
-                if file_item.type == "image":
-                    print("이미지 처리중")
-                    self.upload_web_images(driver, file_item, 'image')
-                elif file_item.type == "text":
-                    print("텍스트 처리중")
-                    self.upload_web_texts(driver, file_item.content)  # content를 인자로 전달하도록 수정될 수 있습니다.
-                elif file_item.type == "video":
-                    print("동영상 처리중")
-                    self.upload_web_images(driver, file_item, 'video')
-                else:
-                    wx.CallAfter(self.append_log, f"알 수 없는 파일 유형: {file_item.path}")
-                    print(f"알 수 없는 파일 유형: {file_item.path}")
+    def save(self, directory=REPORT_DIR):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, time.strftime("run-%Y%m%d-%H%M%S.json", time.localtime(self.started_at)))
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, ensure_ascii=False, indent=2)
+        return path
 
-        #포스팅 내용
-        iframe = driver.find_element(By.ID, "tx_canvas_wysiwyg")
-        driver.switch_to.frame(iframe)
+def describe_items(file_items):
+    return ', '.join(os.path.basename(item.path) if item.path else str(item)[:20] for item in file_items)
 
-        if self.center_checkbox.IsChecked():
-            image_elements = driver.find_elements(By.CSS_SELECTOR, 'img.txc-image')
-
-            for img in image_elements:
-                driver.execute_script("""
-                    arguments[0].parentNode.style.textAlign = 'center';
-                """, img)
-
-            video_elements = driver.find_elements(By.CSS_SELECTOR, 'video_inbox dc_movie_thumbox')
-
-            for video in video_elements:
-                driver.execute_script("""
-                    arguments[0].parentNode.style.textAlign = 'center';
-                """, video)
+class FileItem:
+    def __init__(self, path=None, content=None):
+        self.path = path
+        self.content = content
+        # 실제로 브라우저에 넘길 파일 (최적화가 끝나면 캐시 파일로 바뀐다)
+        self.upload_path = path
 
-            p_elements = driver.find_elements(By.TAG_NAME, 'p')
+        if self.path:
+            self.type = self.determine_file_type()
+        elif self.content:
+            self.type = 'text'
 
-            for p in p_elements:
-                driver.execute_script("""
-                    arguments[0].style.textAlign = 'center';
-                """, p)
+    def determine_file_type(self):
+        _, ext = os.path.splitext(self.path)
+        if ext in ['.jpg', '.png']:
+            return 'image'
+        elif ext == '.txt':
+            return 'text'
+        elif ext in ['.mp4']:
+            return 'video'
+        else:
+            return 'unknown'
 
-        driver.switch_to.default_content()
+    def copy(self):
+        item = FileItem(path=self.path, content=self.content)
+        item.upload_path = self.upload_path
+        return item
 
-        # time.sleep(50)
+    def __str__(self):
+        return self.path or self.content
 
-        apply_button = get_element_by_xpath(driver, apply_button_xpath)
-        apply_button.click()
-        time.sleep(3)
-        # current_url = driver.current_url
-        # wait = WebDriverWait(driver, 30)
-        # wait.until(EC.url_changes(current_url))
-        # time.sleep(100)
+    def count_image_types(file_items):
+        return sum(1 for item in file_items if item.type == "image")
 
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+class GalleryList:
+    # 글을 올릴 갤러리 목록. 줄을 넣을 때 한 번만 검사하고, 정규화한 이름이 같은 줄은 버린다
+    # 화면의 가상 목록이 이 목록을 그대로 보여주므로 GUI 스레드에서만 고친다
+    def __init__(self):
+        self.names = []
+        self.keys = set()
+        # 이름 -> JOB_DONE/JOB_FAILED. 없으면 대기(JOB_PENDING)
+        self.statuses = {}
+        self.positions = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, line):
+        # 'added', 'duplicate', 'invalid', 빈 줄이면 None
+        name = line.strip()
+        if not name:
+            return None
+        if len(name) > GALLERY_NAME_MAX_LENGTH or not name.isprintable():
+            return 'invalid'
+        key = normalize_gallery_name(name)
+        if key in self.keys:
+            return 'duplicate'
+        self.keys.add(key)
+        if self.positions is not None:
+            self.positions[name] = len(self.names)
+        self.names.append(name)
+        return 'added'
+
+    def extend(self, lines):
+        counts = defaultdict(int)
+        for line in lines:
+            result = self.add(line)
+            if result:
+                counts[result] += 1
+        return counts
+
+    def remove(self, indexes):
+        indexes = set(indexes)
+        removed = [name for index, name in enumerate(self.names) if index in indexes]
+        self.names = [name for index, name in enumerate(self.names) if index not in indexes]
+        for name in removed:
+            self.keys.discard(normalize_gallery_name(name))
+            self.statuses.pop(name, None)
+        self.positions = None
+
+    def clear(self):
+        self.names = []
+        self.keys = set()
+        self.statuses = {}
+        self.positions = None
+
+    def status(self, index):
+        return self.statuses.get(self.names[index], JOB_PENDING)
+
+    def set_status(self, name, status):
+        # 목록에서의 위치를 돌려준다. 목록에 없는 이름이면 None
+        if self.positions is None:
+            self.positions = {name: index for index, name in enumerate(self.names)}
+        index = self.positions.get(name)
+        if index is None:
+            return None
+        if status == JOB_PENDING:
+            self.statuses.pop(name, None)
+        else:
+            self.statuses[name] = status
+        return index
+
+    def reset_statuses(self):
+        self.statuses = {}
+
+def iter_line_batches(path, size=GALLERY_LOAD_BATCH):
+    # 파일 전체를 메모리에 올리지 않고 size 줄씩 읽는다
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as file:
+        batch = []
+        for line in file:
+            batch.append(line)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+def dump_job(job):
+    # 비밀번호는 기록하지 않는다. 이어서 실행할 때 다시 받는다
+    data = job._asdict()
+    del data['password']
+    data['file_list'] = [{'path': item.path, 'content': item.content, 'upload_path': item.upload_path}
+                         for item in job.file_list]
+    return data
+
+def campaign_key(job, engine):
+    # 글 내용으로만 만든다. 비밀번호나 최적화 결과 경로(upload_path)가 달라도 같은 작업으로 본다
+    file_list = []
+    for item in job.file_list:
+        if item.path:
+            try:
+                file_list.append(['file', item.path, hash_file(item.path)])
+            except OSError:
+                file_list.append(['file', item.path, None])
+        else:
+            file_list.append(['text', item.content])
+    data = dict(job._asdict(), file_list=file_list)
+    del data['password']
+    return hashlib.sha256((engine + json.dumps(data, ensure_ascii=False, sort_keys=True)).encode()).hexdigest()
+
+def load_job(data, password=''):
+    file_list = []
+    for item in data['file_list']:
+        file_item = FileItem(path=item['path'], content=item['content'])
+        # 최적화 캐시가 지워졌으면 원본을 올린다
+        if item['upload_path'] and os.path.exists(item['upload_path']):
+            file_item.upload_path = item['upload_path']
+        file_list.append(file_item)
+    data = dict(data, file_list=tuple(file_list), password=password)
+    return PostJob(**data)
+
+def is_permanent_error(error):
+    # 사이트가 거절한 글(알림창/실패 응답)은 다시 올려도 같은 결과라 재시도하지 않는다
+    return isinstance(error, SubmitError)
+
+class JobStore:
+    def __init__(self, path=JOB_DB_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # 작업 내용(닉네임, 글)이 들어 있으므로 쿠키 저장소처럼 본인만 읽을 수 있게 한다
+        os.chmod(path, 0o600)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS campaigns (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    campaign_id INTEGER NOT NULL REFERENCES campaigns(id),
+                    gallery TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_run_at REAL NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL,
+                    UNIQUE (campaign_id, gallery)
+                );
+                CREATE INDEX IF NOT EXISTS jobs_status ON jobs (campaign_id, status, next_run_at);
+            """)
+            columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+            if 'owner' not in columns:
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            self.scrub_passwords()
+        # 같은 jobs.db 를 여러 프로그램(화면, 배치)이 같이 쓰므로 누가 잡은 작업인지 남긴다
+        self.owner = f"{os.getpid()}-{os.urandom(4).hex()}"
+
+    def scrub_passwords(self):
+        # 예전 기록에 남은 비밀번호를 지우고, 작업 구분 키도 지금 방식으로 다시 만든다
+        rows = self.conn.execute("SELECT id, engine, payload FROM campaigns").fetchall()
+        for row in rows:
+            data = json.loads(row['payload'])
+            if 'password' not in data:
+                continue
+            job = load_job(data)
+            self.conn.execute("UPDATE campaigns SET key = ?, payload = ? WHERE id = ?",
+                              (campaign_key(job, row['engine']),
+                               json.dumps(dump_job(job), ensure_ascii=False, sort_keys=True), row['id']))
+
+    def create_campaign(self, job, engine, links):
+        payload = json.dumps(dump_job(job), ensure_ascii=False, sort_keys=True)
+        key = campaign_key(job, engine)
+        now = time.time()
+        with self.lock, self.conn:
+            # 새 실행은 이번에 고른 갤러리에만 올린다. 같은 내용으로 이미 올린 갤러리만 건너뛴다
+            done = self.done_galleries(key)
+            # 같은 내용의 이전 실행에서 기다리던 갤러리는 이번 실행으로 옮긴다 (이어서 실행할 때 다시 올리지 않도록)
+            self.conn.executemany("""
+                DELETE FROM jobs WHERE gallery = ? AND status = ?
+                AND campaign_id IN (SELECT id FROM campaigns WHERE key = ?)
+            """, [(gallery, JOB_PENDING, key) for gallery in links])
+            campaign_id = self.conn.execute(
+                "INSERT INTO campaigns (key, engine, payload, created_at) VALUES (?, ?, ?, ?)",
+                (key, engine, payload, now)).lastrowid
+            self.conn.executemany("""
+                INSERT INTO jobs (campaign_id, gallery, url, status, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(campaign_id, gallery, url, JOB_DONE if gallery in done else JOB_PENDING, now)
+                  for gallery, url in links.items()])
+        return campaign_id
+
+    def done_galleries(self, key):
+        rows = self.conn.execute("""
+            SELECT DISTINCT j.gallery FROM jobs j JOIN campaigns c ON c.id = j.campaign_id
+            WHERE c.key = ? AND j.status = ?
+        """, (key, JOB_DONE)).fetchall()
+        return {row['gallery'] for row in rows}
+
+    def skip_done(self, campaign_id):
+        # 이어서 실행할 때, 같은 내용의 다른 실행에서 이미 올린 갤러리는 성공으로 넘긴다
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT key FROM campaigns WHERE id = ?", (campaign_id,)).fetchone()
+            done = self.done_galleries(row['key'])
+            self.conn.executemany("""
+                UPDATE jobs SET status = ?, updated_at = ? WHERE campaign_id = ? AND gallery = ? AND status = ?
+            """, [(JOB_DONE, time.time(), campaign_id, gallery, JOB_PENDING) for gallery in done])
+
+    def load_campaign(self, campaign_id, password=''):
+        with self.lock:
+            row = self.conn.execute("SELECT engine, payload FROM campaigns WHERE id = ?",
+                                    (campaign_id,)).fetchone()
+        return load_job(json.loads(row['payload']), password), row['engine']
+
+    def recover(self):
+        # 비정상 종료로 running 에 남은 작업은 다시 대기열로 돌리고, 끝나지 않은 실행 목록을 돌려준다
+        # 다른 프로그램이 지금 올리고 있는 작업(임대가 살아 있는 것)은 건드리지 않는다
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ?",
+                              (JOB_PENDING, now, JOB_RUNNING, now - JOB_LEASE_SECONDS))
+            rows = self.conn.execute("""
+                SELECT campaign_id, COUNT(*) AS remaining FROM jobs
+                WHERE status = ? GROUP BY campaign_id ORDER BY campaign_id
+            """, (JOB_PENDING,)).fetchall()
+        return [(row['campaign_id'], row['remaining']) for row in rows]
+
+    def claim(self, campaign_id):
+        # (작업, None): 바로 실행할 작업 / (None, 초): 재시도 대기 중 / (None, None): 남은 작업 없음
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute("""
+                SELECT * FROM jobs WHERE campaign_id = ? AND status = ? AND next_run_at <= ?
+                ORDER BY next_run_at, id LIMIT 1
+            """, (campaign_id, JOB_PENDING, now)).fetchone()
+            if row:
+                self.conn.execute("UPDATE jobs SET status = ?, owner = ?, updated_at = ? WHERE id = ?",
+                                  (JOB_RUNNING, self.owner, now, row['id']))
+                return row, None
+            row = self.conn.execute("""
+                SELECT MIN(next_run_at) AS next_run_at FROM jobs WHERE campaign_id = ? AND status = ?
+            """, (campaign_id, JOB_PENDING)).fetchone()
+        if row['next_run_at'] is None:
+            return None, None
+        return None, max(0.0, row['next_run_at'] - now)
+
+    def renew(self):
+        # 이 프로그램이 올리고 있는 작업의 임대를 늘린다
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE jobs SET updated_at = ? WHERE owner = ? AND status = ?",
+                              (time.time(), self.owner, JOB_RUNNING))
+
+    def complete(self, job_id):
+        self.set_status(job_id, JOB_DONE)
+
+    def fail(self, job_id, error):
+        self.set_status(job_id, JOB_FAILED, error)
+
+    def retry(self, job_id, error):
+        # 지수 백오프로 다시 대기열에 넣는다. 횟수를 넘으면 실패로 끝낸다
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            attempts = row['attempts'] + 1
+            if attempts >= JOB_MAX_ATTEMPTS:
+                self.conn.execute("""
+                    UPDATE jobs SET status = ?, attempts = ?, last_error = ?, updated_at = ? WHERE id = ?
+                """, (JOB_FAILED, attempts, str(error), time.time(), job_id))
+                return None
+            delay = min(JOB_BACKOFF_MAX, JOB_BACKOFF_BASE * 2 ** (attempts - 1))
+            self.conn.execute("""
+                UPDATE jobs SET status = ?, attempts = ?, next_run_at = ?, last_error = ?, updated_at = ?
+                WHERE id = ?
+            """, (JOB_PENDING, attempts, time.time() + delay, str(error), time.time(), job_id))
+        return delay
+
+    def defer(self, job_id, delay, error):
+        # 시도 횟수는 그대로 두고 delay 초 뒤로 미룬다
+        with self.lock, self.conn:
+            self.conn.execute("""
+                UPDATE jobs SET status = ?, next_run_at = ?, last_error = ?, updated_at = ? WHERE id = ?
+            """, (JOB_PENDING, time.time() + delay, str(error), time.time(), job_id))
+
+    def set_status(self, job_id, status, error=None):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE jobs SET status = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                              (status, error, time.time(), job_id))
+
+    def statuses(self, campaign_id):
+        with self.lock:
+            rows = self.conn.execute("SELECT gallery, status FROM jobs WHERE campaign_id = ?",
+                                     (campaign_id,)).fetchall()
+        return [(row['gallery'], row['status']) for row in rows]
+
+    def counts(self, campaign_id):
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT status, COUNT(*) AS count FROM jobs WHERE campaign_id = ? GROUP BY status
+            """, (campaign_id,)).fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+class LogSink:
+    # 어느 스레드에서나 write 할 수 있는 링 버퍼. 전체 기록은 백그라운드 스레드가 파일로 남긴다
+    def __init__(self, buffer_size=LOG_BUFFER_SIZE, path=LOG_FILE_PATH):
+        self.lock = threading.Lock()
+        self.buffer = deque(maxlen=buffer_size)
+        self.dropped = 0
+        self.listener = None
+
+        self.logger = logging.getLogger('dcpost')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_FILE_MAX_BYTES,
+                                                                backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        except OSError:
+            return
+        file_handler.setFormatter(logging.Formatter('[%(asctime)s]%(message)s', '%Y-%m-%d %H:%M:%S'))
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.listener.start()
 
-    def run_post_board(self):
+    def write(self, message):
+        current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        with self.lock:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append((current_time, message))
+        self.logger.info(message)
+
+    def drain(self, limit):
+        with self.lock:
+            count = min(limit, len(self.buffer))
+            entries = [self.buffer.popleft() for _ in range(count)]
+            dropped, self.dropped = self.dropped, 0
+        return entries, dropped
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, factor):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate * factor)
+        self.updated = now
+
+    def wait_time(self, factor):
+        # 토큰 하나가 찰 때까지 남은 시간(초)
+        self.refill(factor)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / (self.rate * factor)
+
+class RateGovernor:
+    # 모든 워커(브라우저/HTTP)가 글을 올리기 전에 acquire 한다
+    def __init__(self, log=print, per_minute=RATE_ACCOUNT_PER_MINUTE, burst=RATE_ACCOUNT_BURST,
+                 gallery_interval=RATE_GALLERY_INTERVAL):
+        self.log = log
+        self.per_minute = per_minute
+        self.burst = burst
+        self.gallery_interval = gallery_interval
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.factor = 1.0
+        self.paused_until = 0.0
+
+    def bucket(self, key):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if key[0] == 'account':
+                bucket = TokenBucket(self.per_minute / 60, self.burst)
+            else:
+                bucket = TokenBucket(1 / self.gallery_interval, 1)
+            self.buckets[key] = bucket
+        return bucket
+
+    def acquire(self, account, gallery, cancel=None):
+        # 기다린 시간(초)을 돌려준다. 기다리는 중에 cancel 이 설정되면 RunCancelled
+        start = time.monotonic()
+        while True:
+            with self.lock:
+                account_bucket = self.bucket(('account', account))
+                gallery_bucket = self.bucket(('gallery', gallery))
+                wait = max(self.paused_until - time.monotonic(),
+                           account_bucket.wait_time(self.factor),
+                           gallery_bucket.wait_time(1.0))
+                if wait <= 0:
+                    account_bucket.tokens -= 1
+                    gallery_bucket.tokens -= 1
+                    return time.monotonic() - start
+            if cancel is None:
+                time.sleep(min(wait, 1.0))
+            elif cancel.wait(min(wait, 1.0)):
+                raise RunCancelled()
+
+    def succeeded(self):
+        with self.lock:
+            if self.factor >= 1.0:
+                return
+            self.factor = min(1.0, self.factor + RATE_RECOVERY_STEP)
+            factor = self.factor
+        if factor >= 1.0:
+            self.log("[속도 조절] 게시 속도를 원래대로 되돌립니다")
+
+    def throttled(self, reason):
+        # 이미 가장 느린 속도였으면 False (더 낮출 수 없으니 보통 실패처럼 재시도 횟수를 쓴다)
+        with self.lock:
+            lowered = self.factor > RATE_MIN_FACTOR
+            self.factor = max(RATE_MIN_FACTOR, self.factor * RATE_BACKOFF_FACTOR)
+            self.paused_until = max(self.paused_until, time.monotonic() + RATE_THROTTLE_PAUSE)
+            factor = self.factor
+        self.log(f"[속도 조절] 제한 감지({reason}): 속도를 {factor:.0%}로 낮추고 {RATE_THROTTLE_PAUSE}초 쉽니다")
+        return lowered
+
+    def set_rate(self, per_minute):
+        with self.lock:
+            self.per_minute = per_minute
+            for key, bucket in self.buckets.items():
+                if key[0] == 'account':
+                    bucket.rate = per_minute / 60
+
+    def rate_per_minute(self):
+        with self.lock:
+            return self.per_minute * self.factor
+
+def account_key(job):
+    # 비로그인 글은 IP 단위로 제한되므로 하나로 묶는다
+    return job.nickname if job.login else ''
+
+class PostRunner:
+    # 창 없이도 쓸 수 있는 글쓰기 실행기. 화면(gui.py)과 명령줄 배치 실행이 같이 쓴다
+    def __init__(self, log=print, job_store=None, headless=False, progress=None, gallery_status=None):
+        self.log = log
+        # progress(끝난 수, 전체 수): 실행 중 1초마다 부른다 (실행 스레드에서)
+        self.progress = progress
+        # gallery_status(갤러리 이름, JOB_DONE/JOB_FAILED): 갤러리 결과가 정해질 때마다 부른다 (워커 스레드에서)
+        self.gallery_status = gallery_status
+        self.headless = headless
+        self.driver_pool = DriverPool(self.create_driver)
+        self.gallery_index = GalleryIndex()
+        self.media_cache = MediaCache()
+        self.run_timer = RunTimer()
+        self.job_store = job_store or JobStore()
+        self.cookie_store = CookieStore()
+        self.worker_count = 1
+        self.live_summary = False
+        self.lean_browser = False
+        self.pipeline_uploads = False
+        # 실행이 바뀌어도 계정/갤러리별 속도 기록은 이어진다
+        self.governor = RateGovernor(self.log)
+        # 배치 실행의 시작 준비 시간. 있으면 보고서에 startup 단계로 남긴다
+        self.startup_seconds = None
+        # 브라우저 풀과 실행 기록을 같이 쓰므로 한 번에 하나의 실행만 돌린다
+        self.run_lock = threading.Lock()
+        self.cancel_event = threading.Event()
+
+    def create_driver(self):
         # 웹드라이버 초기화
-        # options = webdriver.ChromeOptions()
-        # options.add_argument('headless')
-        # driver = webdriver.Chrome(options=options)
-        driver = webdriver.Chrome()
-
-        driver.get("https://gall.dcinside.com/")
-
-        self.append_log("Start")
-
+        return create_chrome(headless=self.headless, lean=self.lean_browser)
+
+    def set_lean_browser(self, lean):
+        if lean != self.lean_browser:
+            self.lean_browser = lean
+            # 프로필이 바뀌면 미리 띄워둔 브라우저는 버리고 새로 띄운다
+            self.driver_pool.clear_idle()
+
+    def acquire_driver(self):
+        with self.run_timer.span('driver_start'):
+            driver = self.driver_pool.acquire()
+            driver.get(BASE_URL + "/")
+        return driver
+
+    def configure(self, options):
+        self.worker_count = max(1, min(MAX_WORKERS, options.workers))
+        self.live_summary = options.live_summary
+        self.set_lean_browser(options.lean_browser)
+        self.pipeline_uploads = options.pipeline_uploads
+        self.governor.set_rate(options.posts_per_minute)
+
+    def is_running(self):
+        return self.run_lock.locked()
+
+    def cancel(self):
+        if self.is_running() and not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.log("취소 요청: 진행 중인 단계가 끝나면 멈춥니다")
+
+    def shutdown(self):
+        self.driver_pool.shutdown()
+
+    def reset_run(self):
+        # 같은 실행 안에서만 업로드한 미디어를 다시 쓴다
+        self.media_cache = MediaCache()
+        self.run_timer = RunTimer()
+        # 대기 시간은 이번 실행에서 관찰한 값으로 다시 배운다
+        selector_stats.reset()
+
+    def browser_poster(self):
+        return BrowserPoster(self.log, self.media_cache, self.run_timer, self.cookie_store,
+                             lean=self.lean_browser, pipeline=self.pipeline_uploads, cancel=self.cancel_event)
+
+    def http_engine_ready(self):
+        if requests is None:
+            self.log("[ERROR] HTTP 엔진을 쓰려면 requests 패키지가 필요합니다")
+            return False
+        if not USES_TEST_SERVER:
+            # 확인되지 않은 주소로 실제 사이트에 계정 정보와 글을 보내지 않는다
+            self.log("[ERROR] HTTP 엔진은 실험용으로 테스트 서버(mock_site.py)에서만 쓸 수 있습니다")
+            return False
+        return True
+
+    def http_poster(self):
+        return HttpPoster(media_cache=self.media_cache, run_timer=self.run_timer, cookie_store=self.cookie_store,
+                          cancel=self.cancel_event)
+
+    def find_gallery_links(self, fetch_anchors, names):
+        with self.run_timer.span('gallery_lookup'):
+            matching_links, missing = self.gallery_index.resolve(fetch_anchors, names)
+        for data in missing:
+            self.log(f"[ERROR] {data} 갤러리를 찾을 수 없습니다.")
+            self.report_status(data, JOB_FAILED)
+        return matching_links
+
+    def report_status(self, gallery, status):
+        if self.gallery_status is not None:
+            self.gallery_status(gallery, status)
+
+    def start_run(self, options):
+        # 이미 실행 중이면 False. 성공하면 끝날 때 finish_run 을 불러야 한다
+        if not self.run_lock.acquire(blocking=False):
+            self.log("[ERROR] 이미 실행 중인 작업이 있습니다")
+            return False
+        self.cancel_event.clear()
+        self.configure(options)
+        return True
+
+    def finish_run(self):
+        self.cancel_event.clear()
+        self.run_lock.release()
+
+    def resume_campaigns(self, passwords, options):
+        # passwords: 작업 번호 -> 비밀번호 (작업 기록에는 비밀번호를 남기지 않는다)
+        # 엔진은 작업을 처음 만들 때 고른 것을 그대로 쓴다
+        if not self.start_run(options):
+            return
         try:
-            if self.login_check.IsChecked():
-                login_button_element = get_clickable_element_by_xpath(driver,
-                                                                      '/html/body/div[2]/header/div/div[2]/ul/li[10]/a')
-                login_button_element.click()
-
-                login_id_input_element = get_element_by_xpath(driver,
-                                                              '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/div[1]/input[1]')
+            for campaign_id, password in passwords.items():
+                if self.cancel_event.is_set():
+                    break
+                job, engine = self.job_store.load_campaign(campaign_id, password)
+                self.log(f"이전 작업 #{campaign_id} 이어서 실행")
+                self.job_store.skip_done(campaign_id)
+                self.reset_run()
+                self.run_campaign(campaign_id, job, engine)
+        finally:
+            self.finish_run()
+
+    def run(self, job, names, options):
+        # 만든 작업 번호를 돌려준다. 시작하지 못했으면 None
+        if not self.start_run(options):
+            return None
+        try:
+            return self.start_campaign(job, options.engine, names)
+        finally:
+            self.finish_run()
+
+    def start_campaign(self, job, engine, names):
+        self.reset_run()
+        if self.startup_seconds is not None:
+            self.run_timer.record('startup', self.startup_seconds)
+        if self.pipeline_uploads and requests is None:
+            self.log("업로드를 미리 시작하려면 requests 패키지가 필요합니다 (순서대로 올립니다)")
+        elif self.pipeline_uploads and not USES_TEST_SERVER:
+            self.log("첨부 파일 먼저 올리기는 테스트 서버 전용입니다 (순서대로 올립니다)")
+        if job.login and not self.cookie_store.enabled:
+            self.log("로그인 쿠키를 저장하려면 cryptography 패키지가 필요합니다 (매번 로그인합니다)")
+
+        if engine == ENGINE_HTTP:
+            if not self.http_engine_ready():
+                return None
+            poster = self.http_poster()
+            self.log("Start (HTTP)")
+            matching_links = self.find_gallery_links(poster.fetch_gallery_anchors, names)
+            if not matching_links:
+                self.log("[ERROR] 아무 갤러리도 찾을 수 없습니다")
+                poster.close()
+                return None
+            campaign_id = self.job_store.create_campaign(job, ENGINE_HTTP, matching_links)
+            self.run_campaign(campaign_id, job, ENGINE_HTTP, poster=poster)
+            return campaign_id
+
+        poster = self.browser_poster()
+        try:
+            driver = self.acquire_driver()
+        except WebDriverException:
+            self.log("[ERROR] 브라우저를 시작하지 못했습니다")
+            return None
 
-                login_id_input_element.send_keys(self.nickName_entry.GetValue())
+        self.log("Start")
 
-                login_password_input_element = get_element_by_xpath(driver,
-                                                                    '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/div[1]/input[2]')
-                login_password_input_element.send_keys(self.password_input_entry.GetValue())
+        if not poster.login(driver, job):
+            self.driver_pool.release(driver)
+            return None
 
-                login_submit_btn = get_clickable_element_by_xpath(driver,
-                                                                  '/html/body/div[2]/main/div/article/section/div/div[1]/div/form/fieldset/button')
-                current_url = driver.current_url
+        matching_links = self.find_gallery_links(lambda page: fetch_driver_anchors(driver, page), names)
 
-                login_submit_btn.click()
-                wait = WebDriverWait(driver, 3)
-                wait.until(EC.url_changes(current_url))
-        except:
-            wx.CallAfter(self.append_log, f"[ERROR] 로그인에 실패하였습니다")
-            driver.quit()
+        if not matching_links:
+            self.log("[ERROR] 아무 갤러리도 찾을 수 없습니다")
+            self.driver_pool.release(driver)
+            return None
+
+        campaign_id = self.job_store.create_campaign(job, ENGINE_BROWSER, matching_links)
+        self.run_campaign(campaign_id, job, ENGINE_BROWSER, driver=driver, poster=poster)
+        return campaign_id
+
+    def run_campaign(self, campaign_id, job, engine, driver=None, poster=None):
+        if self.gallery_status is not None:
+            # 이어서 실행하는 경우 이미 결과가 난 갤러리부터 알려준다
+            for gallery, status in self.job_store.statuses(campaign_id):
+                if status in (JOB_DONE, JOB_FAILED):
+                    self.report_status(gallery, status)
+        counts = self.job_store.counts(campaign_id)
+        if counts.get(JOB_DONE):
+            self.log(f"이미 올린 갤러리 {counts[JOB_DONE]}개는 건너뜁니다")
+        pending = counts.get(JOB_PENDING, 0)
+        if not pending:
+            if driver is not None:
+                self.driver_pool.release(driver)
+            if poster is not None:
+                poster.close()
             return
 
-        matching_links = {}
-        for data in self.data_list:
-            if not data:
-                break
-            try:
-                a_element = driver.find_element(By.XPATH, f"//li/a[text()='{data}']")
-                matching_links[data] = a_element.get_attribute('href')
-            except:
-                wx.CallAfter(self.append_log, f"[ERROR] {data} 갤러리를 찾을 수 없습니다.")
+        if poster is None:
+            if engine == ENGINE_HTTP:
+                if not self.http_engine_ready():
+                    return
+                poster = self.http_poster()
+            else:
+                poster = self.browser_poster()
+
+        worker_count = min(self.worker_count, pending)
+        workers = []
+        for worker_id in range(1, worker_count + 1):
+            if engine == ENGINE_HTTP:
+                worker = threading.Thread(target=self.http_post_worker,
+                                          args=(worker_id, poster, job, campaign_id))
+            else:
+                # 첫 번째 워커는 갤러리 검색에 쓴 브라우저를 그대로 이어받는다
+                worker_driver = driver if worker_id == 1 else None
+                worker = threading.Thread(target=self.post_worker,
+                                          args=(worker_id, poster, job, campaign_id, worker_driver))
+            worker.start()
+            workers.append(worker)
+
+        last_summary = time.monotonic()
+        last_renew = time.monotonic()
+        self.report_progress(campaign_id)
+        for worker in workers:
+            while worker.is_alive():
+                worker.join(timeout=1.0)
+                self.report_progress(campaign_id)
+                if time.monotonic() - last_renew >= JOB_LEASE_RENEW:
+                    last_renew = time.monotonic()
+                    self.job_store.renew()
+                if self.live_summary and time.monotonic() - last_summary >= LIVE_SUMMARY_INTERVAL:
+                    last_summary = time.monotonic()
+                    summary = self.run_timer.summary()
+                    if summary:
+                        self.log(f"[요약] {summary}")
+        poster.close()
+        if engine == ENGINE_BROWSER:
+            self.log_page_load()
 
-        if not matching_links:
-            wx.CallAfter(self.append_log, "[ERROR] 아무 갤러리도 찾을 수 없습니다")
-            driver.quit()
+        try:
+            report_path = self.run_timer.save()
+            self.log(f"실행 보고서: {report_path}")
+        except OSError:
+            pass
+
+        counts = self.job_store.counts(campaign_id)
+        hours = (time.time() - self.run_timer.started_at) / 3600
+        self.log(f"완료: 성공 {counts.get(JOB_DONE, 0)}개, 실패 {counts.get(JOB_FAILED, 0)}개 "
+                 f"(시간당 {counts.get(JOB_DONE, 0) / hours if hours else 0:.0f}개, "
+                 f"현재 속도 분당 {self.governor.rate_per_minute():.1f}개)")
+        remaining = counts.get(JOB_PENDING, 0) + counts.get(JOB_RUNNING, 0)
+        if remaining and self.cancel_event.is_set():
+            self.log(f"취소됨: 남은 갤러리 {remaining}개는 다음에 이어서 실행할 수 있습니다")
+        elif remaining:
+            self.log(f"[ERROR] 처리되지 못한 갤러리 {remaining}개가 남았습니다")
+
+    def report_progress(self, campaign_id):
+        if self.progress is None:
             return
+        counts = self.job_store.counts(campaign_id)
+        self.progress(counts.get(JOB_DONE, 0) + counts.get(JOB_FAILED, 0), sum(counts.values()))
 
-        for link_text, link_url in matching_links.items():
-            wx.CallAfter(self.append_log, f"{link_text} 갤러리 접속...")
-            # self.append_log(f"{link_text} 갤러리 접속...")
-            driver.get(link_url)
+    def log_page_load(self):
+        stats = self.run_timer.stages().get('open_gallery')
+        if not stats:
+            return
+        profile = 'lean' if self.lean_browser else 'default'
+        try:
+            with open(PAGE_LOAD_STATS_PATH, 'r', encoding='utf-8') as file:
+                history = json.load(file)
+        except (OSError, ValueError):
+            history = {}
+        history[profile] = stats['p50']
+        try:
+            os.makedirs(os.path.dirname(PAGE_LOAD_STATS_PATH), exist_ok=True)
+            with open(PAGE_LOAD_STATS_PATH, 'w', encoding='utf-8') as file:
+                json.dump(history, file)
+        except OSError:
+            pass
+
+        label = '가벼운 프로필' if self.lean_browser else '기본 프로필'
+        message = f"목록 화면 로딩 p50 {stats['p50']:.2f}초 ({label})"
+        # 두 프로필 기록이 다 있으면 차이를 같이 보여준다
+        if history.get('lean') and history.get('default'):
+            change = (history['lean'] - history['default']) / history['default'] * 100
+            message += f", 가벼운 {history['lean']:.2f}초 / 기본 {history['default']:.2f}초 ({change:+.0f}%)"
+        self.log(message)
+
+    def next_job(self, campaign_id):
+        # 재시도 대기 중인 작업만 남았으면 때가 될 때까지 기다린다
+        # 취소되면 새 작업을 꺼내지 않는다
+        while not self.cancel_event.is_set():
+            row, wait = self.job_store.claim(campaign_id)
+            if row is not None or wait is None:
+                return row
+            self.cancel_event.wait(min(wait, 1.0))
+        return None
+
+    def wait_turn(self, job, gallery):
+        waited = self.governor.acquire(account_key(job), gallery, self.cancel_event)
+        if waited:
+            self.run_timer.record('rate_wait', waited, gallery)
+
+    def record_failure(self, row, error):
+        link_text = row['gallery']
+        if isinstance(error, ThrottledError) and self.governor.throttled(error):
+            # 사이트가 막은 것은 글 문제가 아니므로 재시도 횟수를 쓰지 않고 쉬는 시간 뒤로 미룬다
+            self.job_store.defer(row['id'], RATE_THROTTLE_PAUSE, error)
+            self.log(f"{link_text} 갤러리 업로드 보류, {RATE_THROTTLE_PAUSE}초 후 다시 시도합니다")
+            return
+        if is_permanent_error(error):
+            self.job_store.fail(row['id'], str(error))
+            self.log(f"[ERROR] {link_text} 갤러리 업로드 실패: {error}")
+            self.report_status(link_text, JOB_FAILED)
+            return
+        delay = self.job_store.retry(row['id'], str(error) or type(error).__name__)
+        if delay is None:
+            self.log(f"[ERROR] {link_text} 갤러리 업로드 실패 (재시도 횟수 초과)")
+            self.report_status(link_text, JOB_FAILED)
+        else:
+            self.log(f"{link_text} 갤러리 업로드 실패, {delay}초 후 다시 시도합니다")
+
+    def http_post_worker(self, worker_id, poster, job, campaign_id):
+        with poster.session() as session:
+            if job.login:
+                try:
+                    with self.run_timer.span('login'):
+                        poster.login(session, job)
+                except Exception:
+                    self.log("[ERROR] 로그인에 실패하였습니다")
+                    return
+
+            while True:
+                row = self.next_job(campaign_id)
+                if row is None:
+                    break
+                link_text = row['gallery']
+
+                try:
+                    self.wait_turn(job, link_text)
+                    self.log(f"[{worker_id}] {link_text} 갤러리 접속...")
+                    with self.run_timer.gallery(link_text), self.run_timer.span('post'):
+                        signal, latency = poster.post_content(session, job, row['url'])
+                    self.job_store.complete(row['id'])
+                    self.report_status(link_text, JOB_DONE)
+                    self.governor.succeeded()
+                    self.log(f"[SUCCESS] {link_text} 갤러리 업로드 성공 (등록 {latency:.2f}초, {signal})")
+                except RunCancelled:
+                    # 올리지 않은 글은 대기열로 돌려서 이어서 실행할 때 다시 올린다
+                    self.job_store.set_status(row['id'], JOB_PENDING)
+                    break
+                except Exception as e:
+                    self.record_failure(row, e)
+
+    def post_worker(self, worker_id, poster, job, campaign_id, driver=None):
+        if driver is None:
             try:
-                self.post_content(driver)
-                wx.CallAfter(self.append_log, f"[SUCCESS] {link_text} 갤러리 업로드 성공")
-                # self.append_log(f"[SUCCESS] {link_text} 갤러리 업로드 성공")
-            except:
-                wx.CallAfter(self.append_log, f"[ERROR] {link_text} 갤러리 업로드 실패")
-                # self.append_log(f"[ERROR] {link_text} 갤러리 업로드 실패")
-
-        driver.quit()
-
-    def run_thread(self, event):
-        thread = threading.Thread(target=self.run_post_board)
-        thread.start()
-    def load_file(self, event):
-        filepath = wx.FileDialog(self, "Open TXT file", wildcard="TXT files (*.txt)|*.txt", style=wx.FD_OPEN)
-        if filepath.ShowModal() == wx.ID_OK:
-            with open(filepath.GetPath(), 'r') as file:
-                content = file.read()
-                self.add_txt_file(content)
-                if len(content) > 8:
-                    extracted_string = content[:8] + "..."
-                else:
-                    extracted_string = content
-                self.file_listbox.Append(extracted_string)
-                # content = file.read()
-                # self.text_widget.SetValue(content)
-        filepath.Destroy()
-
-    def upload_content(self, event):
-        content = self.text_widget.GetValue()
-
-        if content:
-            file_item = FileItem(content=content)
-            self.file_list.append(file_item)
-            if len(content) > 8:
-                extracted_string = content[:8] + "..."
+                driver = self.acquire_driver()
+            except WebDriverException:
+                self.log(f"[ERROR] [{worker_id}] 브라우저를 시작하지 못했습니다")
+                return
+            if not poster.login(driver, job):
+                self.driver_pool.release(driver)
+                return
+
+        while True:
+            row = self.next_job(campaign_id)
+            if row is None:
+                break
+            link_text = row['gallery']
+
+            try:
+                self.wait_turn(job, link_text)
+                self.log(f"[{worker_id}] {link_text} 갤러리 접속...")
+                with self.run_timer.gallery(link_text), self.run_timer.span('post'):
+                    with self.run_timer.span('open_gallery'):
+                        poster.open_gallery(driver, row['url'])
+                    signal, latency = poster.post_content(driver, job)
+                self.job_store.complete(row['id'])
+                self.report_status(link_text, JOB_DONE)
+                self.governor.succeeded()
+                self.log(f"[SUCCESS] {link_text} 갤러리 업로드 성공 (등록 {latency:.2f}초, {signal})")
+            except RunCancelled:
+                self.job_store.set_status(row['id'], JOB_PENDING)
+                break
+            except Exception as e:
+                self.record_failure(row, e)
+                if is_driver_alive(driver):
+                    continue
+                # 브라우저가 죽은 경우 이 워커만 새 브라우저로 다시 시작
+                self.log(f"[{worker_id}] 브라우저가 종료되어 다시 시작합니다")
             else:
-                extracted_string = content
-            self.file_listbox.Append(extracted_string)
-
-        self.text_widget.SetValue('')
-
-    def on_load(self, event):
-        filepath = wx.FileDialog(self, "Open TXT file", wildcard="TXT files (*.txt)|*.txt", style=wx.FD_OPEN)
-        if filepath.ShowModal() == wx.ID_OK:
-            with open(filepath.GetPath(), 'r', encoding='utf-8') as file:
-                self.data_list = file.read().split('\n')
-                self.url_text_widget.SetValue('\n'.join(self.data_list))
-
-    def upload_image(self, event):
-        filepath = wx.FileDialog(self, "Open Image file", wildcard="Image files (*.jpg;*.png)|*.jpg;*.png", style=wx.FD_OPEN)
-        if filepath.ShowModal() == wx.ID_OK:
-            # 선택한 이미지의 경로를 리스트에 추가
-            self.add_file(filepath.GetPath())
-            # self.image_list.append(filepath.GetPath())
-            # 이제 ListBox에도 업로드된 이미지의 경로를 추가
-            self.file_listbox.Append(filepath.GetPath())
-        filepath.Destroy()
-
-    def upload_video(self, event):
-        filepath = wx.FileDialog(self,
-                                 "Open Video file",
-                                 wildcard="Video files (*.mp4;*.avi;*.mov;*.webm)|*.mp4;*.avi;*.mov;*.webm",
-                                 style=wx.FD_OPEN)
-        if filepath.ShowModal() == wx.ID_OK:
-            self.add_file(filepath.GetPath())
-            self.file_listbox.Append(filepath.GetPath())
-        filepath.Destroy()
-
-    def on_move_up(self, event):
-        selection = self.file_listbox.GetSelection()
-        if selection > 0:
-            current_label = self.file_listbox.GetString(selection)
-            self.file_listbox.Delete(selection)
-            self.file_listbox.Insert(current_label, selection - 1)
-            self.file_listbox.SetSelection(selection - 1)
-            self.file_list[selection], self.file_list[selection-1] = self.file_list[selection-1], self.file_list[selection]
-
-    def on_move_down(self, event):
-        selection = self.file_listbox.GetSelection()
-        if selection < (self.file_listbox.GetCount() - 1) and selection != wx.NOT_FOUND:
-            current_label = self.file_listbox.GetString(selection)
-            self.file_listbox.Delete(selection)
-            self.file_listbox.Insert(current_label, selection + 1)
-            self.file_listbox.SetSelection(selection + 1)
-
-            self.file_list[selection], self.file_list[selection + 1] = self.file_list[selection + 1], \
-            self.file_list[selection]
-
-    def on_delete_selected(self, event):
-        selection = self.file_listbox.GetSelection()
-        if selection != wx.NOT_FOUND:
-            self.file_listbox.Delete(selection)
-            del self.file_list[selection]
-
-app = wx.App()
-PostApp(None, title="Post")
-app.MainLoop()
\ No newline at end of file
+                if not self.driver_pool.record_post(driver):
+                    continue
+                # 글을 많이 올렸거나 메모리가 많이 늘어난 브라우저는 실행 중에도 새로 바꾼다
+                self.log(f"[{worker_id}] 브라우저를 새로 바꿉니다")
+
+            self.driver_pool.discard(driver)
+            try:
+                driver = self.acquire_driver()
+            except WebDriverException:
+                self.log(f"[ERROR] [{worker_id}] 브라우저를 다시 시작하지 못했습니다")
+                return
+            if not poster.login(driver, job):
+                self.driver_pool.release(driver)
+                return
+
+        self.driver_pool.release(driver)
+
+def read_gallery_names(lines):
+    # 화면과 같은 규칙으로 빈 줄/잘못된 줄/중복을 건너뛴다
+    gallery_list = GalleryList()
+    gallery_list.extend(lines)
+    return gallery_list.names
+
+def load_campaign_file(path):
+    # 배치 실행용 작업 파일(JSON)을 읽어 (작업, 엔진, 갤러리 이름, 설정)을 돌려준다
+    # 상대 경로는 작업 파일이 있는 폴더 기준이다. 예:
+    # {"galleries": "list.txt" 또는 ["갤러리1", ...], "title": "제목", "nickname": "닉", "password": "비번",
+    #  "login": false, "body": ["글", {"file": "a.png"}, {"file": "b.txt"}], "font_size": "14px",
+    #  "bold": false, "center": false, "engine": "browser", "workers": 2, "optimize_images": true,
+    #  "lean_browser": false, "pipeline_uploads": false, "posts_per_minute": 4}
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    def resolve(file_path):
+        return os.path.join(base_dir, os.path.expanduser(file_path))
+
+    galleries = data.get('galleries', [])
+    if isinstance(galleries, str):
+        with open(resolve(galleries), 'r', encoding='utf-8') as file:
+            names = read_gallery_names(file)
+    else:
+        names = read_gallery_names(galleries)
+
+    file_list = []
+    for part in data.get('body', []):
+        if isinstance(part, str):
+            part = {'text': part}
+        if 'text' in part:
+            file_list.append(FileItem(content=part['text']))
+            continue
+        file_path = resolve(part['file'])
+        if not os.path.exists(file_path):
+            raise ValueError(f"파일이 없습니다: {file_path}")
+        if os.path.splitext(file_path)[1] == '.txt':
+            # 화면의 'txt 파일 업로드' 처럼 내용을 본문 글로 넣는다
+            with open(file_path, 'r', encoding='utf-8') as file:
+                file_list.append(FileItem(content=file.read()))
+        else:
+            file_list.append(FileItem(path=file_path))
+
+    job = PostJob(nickname=data.get('nickname', ''),
+                  password=data.get('password') or os.environ.get('DCPOST_PASSWORD', ''),
+                  title=data['title'],
+                  file_list=tuple(file_list),
+                  font_size=data.get('font_size', ''),
+                  bold=bool(data.get('bold', False)),
+                  center=bool(data.get('center', False)),
+                  login=bool(data.get('login', False)))
+    engine = data.get('engine', ENGINE_BROWSER)
+    if engine not in ENGINE_LABELS:
+        raise ValueError(f"알 수 없는 엔진: {engine}")
+    options = {
+        'workers': max(1, min(MAX_WORKERS, int(data.get('workers', 1)))),
+        'optimize_images': bool(data.get('optimize_images', Image is not None)),
+        'lean_browser': bool(data.get('lean_browser', False)),
+        'pipeline_uploads': bool(data.get('pipeline_uploads', False)),
+        'posts_per_minute': float(data.get('posts_per_minute', RATE_ACCOUNT_PER_MINUTE)),
+    }
+    return job, engine, names, options
+
+def optimize_job_images(job, log):
+    items = [item for item in job.file_list if item.type == 'image']
+    if not items or Image is None:
+        return
+    optimized = 0
+    with ProcessPoolExecutor(max_workers=IMAGE_OPTIMIZE_WORKERS) as pool:
+        futures = [(item, pool.submit(optimize_image, item.path)) for item in items]
+        for item, future in futures:
+            try:
+                item.upload_path = future.result()
+                optimized += 1
+            except Exception as e:
+                # 최적화하지 못한 파일은 원본을 올린다
+                log(f"[ERROR] 이미지 최적화 실패: {os.path.basename(item.path)} ({e})")
+    log(f"이미지 최적화: {optimized}개")
+
+def console_log(message):
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    print("[" + current_time + "]" + message, flush=True)
+
+def run_batch(args):
+    started_at = time.perf_counter()
+    try:
+        job, engine, names, options = load_campaign_file(args.campaign)
+    except (OSError, ValueError, KeyError) as e:
+        console_log(f"[ERROR] 작업 파일을 읽지 못했습니다: {e!r}")
+        return 2
+    load_seconds = time.perf_counter() - started_at
+    if not names:
+        console_log("[ERROR] 갤러리 목록이 비어 있습니다")
+        return 2
+    if args.workers:
+        options['workers'] = max(1, min(MAX_WORKERS, args.workers))
+    if options['optimize_images'] and not args.no_optimize:
+        optimize_job_images(job, console_log)
+
+    run_options = RunOptions(engine=engine,
+                             workers=options['workers'],
+                             live_summary=args.live_summary,
+                             lean_browser=options['lean_browser'] or args.lean,
+                             pipeline_uploads=options['pipeline_uploads'] or args.pipeline,
+                             posts_per_minute=args.rate or options['posts_per_minute'])
+    runner = PostRunner(console_log, headless=not args.headed)
+    # 비정상 종료로 running 에 남은 작업을 대기열로 돌린다. 다른 프로그램이 올리고 있는 작업은 그대로 둔다
+    runner.job_store.recover()
+    # Ctrl+C 는 화면의 취소 버튼처럼 단계가 끝나는 곳에서 멈춘다
+    signal.signal(signal.SIGINT, lambda signum, frame: runner.cancel())
+    # 시작 준비 시간: import 와 작업 파일 읽기에 걸린 시간. 브라우저 시작은 보고서의 driver_start 에 있다
+    import_seconds = started_at - IMPORT_STARTED_AT
+    console_log(f"시작 준비: import {import_seconds:.2f}초, 작업 파일 {load_seconds:.2f}초")
+    runner.startup_seconds = import_seconds + load_seconds
+    try:
+        campaign_id = runner.run(job, names, run_options)
+        if campaign_id is None:
+            return 1
+        stages = runner.run_timer.stages()
+        if 'driver_start' in stages:
+            console_log(f"첫 브라우저 준비: {stages['driver_start']['max']:.2f}초")
+        counts = runner.job_store.counts(campaign_id)
+        # 찾지 못한 갤러리는 작업으로 만들어지지 않으므로 따로 센다
+        missing = set(names) - {gallery for gallery, _ in runner.job_store.statuses(campaign_id)}
+    finally:
+        runner.shutdown()
+    if missing or counts.get(JOB_FAILED) or counts.get(JOB_PENDING) or counts.get(JOB_RUNNING):
+        return 1
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러리 글쓰기. 작업 파일을 주면 창 없이 실행한다")
+    parser.add_argument('campaign', nargs='?', help="작업 파일(JSON). 없으면 창을 띄운다")
+    parser.add_argument('--workers', type=int, help="동시 실행 수 (작업 파일 값보다 우선)")
+    parser.add_argument('--headed', action='store_true', help="크롬 창을 띄워서 실행")
+    parser.add_argument('--lean', action='store_true', help="가벼운 브라우저 프로필 (광고/목록 이미지 차단)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="글쓰기 화면이 열리면 첨부 파일부터 올리기 시작 (테스트 서버 전용)")
+    parser.add_argument('--rate', type=float, help="계정당 분당 글 수 (작업 파일 값보다 우선)")
+    parser.add_argument('--no-optimize', action='store_true', help="이미지 최적화를 하지 않는다")
+    parser.add_argument('--live-summary', action='store_true', help="실행 중 소요 시간 요약 표시")
+    args = parser.parse_args(argv)
+
+    if args.campaign:
+        return run_batch(args)
+
+    # wx 는 창을 띄울 때만 불러온다
+    # python main.py 로 실행하면 이 파일은 __main__ 이므로, gui 의 "from main import" 가 파일을 한 번 더 읽어
+    # selector_stats 같은 상태가 둘로 나뉘지 않도록 지금 모듈을 main 으로 등록해 둔다
+    sys.modules.setdefault('main', sys.modules[__name__])
+    import gui
+    gui.run()
+    return 0
+
+if __name__ == '__main__':
+    # 이미지 최적화 프로세스 풀이 이 파일을 다시 import 해도 창이 뜨지 않도록 한다
+    sys.exit(main())
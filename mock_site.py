@@ -0,0 +1,528 @@
+import argparse
+import base64
+import json
+import secrets
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# 로컬 테스트용 디시인사이드 흉내 서버
+# main.py 가 찾는 XPath 구조(갤러리 링크, 글쓰기 버튼, 에디터 iframe, 사진/동영상 팝업, 등록 버튼)와
+# HTTP 엔진이 쓰는 업로드/등록 주소를 같이 제공한다.
+# 사용법: python mock_site.py --port 8080 --latency 0.1
+#         DCPOST_BASE_URL=http://127.0.0.1:8080 python main.py
+
+DEFAULT_GALLERIES = {
+    '테스트': 'test',
+    '프로그래밍': 'programming',
+    '사진': 'photo',
+}
+
+SESSION_COOKIE = 'PHPSESSID'
+LOGIN_LINK = '<li><a href="/login">로그인</a></li>'
+LOGOUT_LINK = '<li><a href="/logout">로그아웃</a></li>'
+
+# 1x1 투명 PNG (업로드된 미디어 주소가 돌려주는 그림)
+PIXEL_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==')
+
+HEADER = """<div id="skip"></div>
+<div id="top">
+<header><div>
+<div class="logo"><a href="/">dcinside</a></div>
+<div class="gnb"><ul>
+<li><a href="/">메인</a></li><li><a href="/">갤러리</a></li><li><a href="/m">마이너</a></li>
+<li><a href="/n">미니</a></li><li><a href="/">인물</a></li><li><a href="/">뉴스</a></li>
+<li><a href="/">이벤트</a></li><li><a href="/">갤로그</a></li><li><a href="/">디시콘</a></li>
+{account}
+</ul></div>
+</div></header>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>mock dcinside</title></head>
+<body>
+{header}
+<main><ul class="gall_list_menu">{anchors}</ul></main>
+</div>
+</body></html>
+"""
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>login</title></head>
+<body>
+<div id="skip"></div>
+<div id="top">
+<main><div><article><section><div>
+<div><div>
+<form method="post" action="/login/member_check?redirect=1"><fieldset>
+<div><input type="text" name="user_id"><input type="password" name="pw"></div>
+<button type="submit">로그인</button>
+</fieldset></form>
+</div></div>
+</div></section></article></div></main>
+</div>
+</body></html>
+"""
+
+LIST_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{gallery_id}</title></head>
+<body>
+<div id="skip"></div>
+<div id="top">
+<div class="dcheader"></div>
+<div class="gnb_bar"></div>
+<div class="wrap_inner">
+<main>
+<section>
+<article class="gall_title"></article>
+<article>
+<div class="list_array_option"></div>
+<div class="gall_listwrap"><table class="gall_list"><tbody>{rows}</tbody></table></div>
+<div class="list_bottom_btnbox">
+<div class="fl"></div>
+<div class="fr"><button type="button" onclick="location.href='{board}/write/?id={gallery_id}'">글쓰기</button></div>
+</div>
+</article>
+</section>
+</main>
+</div>
+</div>
+</body></html>
+"""
+
+FONT_SIZES = ["8px", "9px", "10px", "11px", "12px", "14px", "18px", "24px", "36px"]
+
+EDITOR = """<div class="editor_wrap">
+<div class="tx-toolbar-top"></div>
+<div class="tx-toolbar"><div>
+<ul class="tx-bar-left">
+<li id="tx_image"><a href="javascript:;" onclick="openPopup('/upload/image')">사진</a></li>
+<li id="tx_movie"><a href="javascript:;" onclick="openPopup('/upload/movie')">동영상</a></li>
+</ul>
+<ul class="tx-bar-font"><li><div><a href="javascript:;" onclick="toggleFontMenu()">글자 크기</a></div>
+<div id="tx_fontsize_menu" style="display:none"><ul>{sizes}</ul></div></li></ul>
+<ul class="tx-bar-style"><li><div><a href="javascript:;" onclick="editorCommand('bold')">굵게</a></div></li></ul>
+</div></div>
+<iframe id="tx_canvas_wysiwyg" src="/editor/canvas" style="width:100%;height:300px"></iframe>
+</div>
+"""
+
+WRITE_SCRIPT = """<script>
+function editorBody() {
+    return document.getElementById('tx_canvas_wysiwyg').contentDocument.body;
+}
+function openPopup(url) {
+    window.open(url, url, 'width=600,height=500');
+}
+function toggleFontMenu() {
+    var menu = document.getElementById('tx_fontsize_menu');
+    menu.style.display = menu.style.display === 'none' ? 'block' : 'none';
+}
+function setFontSize(size) {
+    editorBody().style.fontSize = size;
+}
+function editorCommand(command) {
+    var frame = document.getElementById('tx_canvas_wysiwyg');
+    frame.contentDocument.execCommand(command, false, null);
+}
+function insertMedia(html) {
+    var body = editorBody();
+    body.insertAdjacentHTML('beforeend', html);
+}
+function clearGallNick() {
+    var input = document.querySelector('.gall_nick');
+    input.value = '';
+    input.style.display = 'none';
+}
+function submitWrite() {
+    var form = document.getElementById('write');
+    form.memo.value = editorBody().innerHTML;
+    form.submit();
+}
+</script>
+"""
+
+WRITE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>write</title></head>
+<body>
+<div id="skip"></div>
+<div id="top">
+<main><section>
+<article class="gall_title"></article>
+<article>
+<form id="write" method="post" action="{board}/forms/article_submit?redirect=1">
+{fields}
+</form>
+</article>
+</section></main>
+</div>
+{script}
+</body></html>
+"""
+
+ANONYMOUS_FIELDS = """<div><fieldset>
+<div><input type="text" class="gall_nick" value="ㅇㅇ" readonly><button type="button" onclick="clearGallNick()">x</button><input type="text" name="name" value=""></div>
+<div><input type="password" name="password" value=""></div>
+<div><input type="text" name="subject" id="subject" value=""></div>
+</fieldset></div>
+<div>{hidden}</div>
+<div class="write_type">{editor}</div>
+<div class="write_info"></div>
+<div class="btn_box"><button type="button">취소</button><button type="button" onclick="submitWrite()">등록</button></div>
+"""
+
+MEMBER_FIELDS = """<div><fieldset>
+<div><input type="text" name="subject" id="subject" value=""></div>
+</fieldset></div>
+<div>{hidden}</div>
+<div class="write_notice"></div>
+<div class="write_type">{editor}</div>
+<div class="write_info"></div>
+<div class="btn_box"><button type="button">취소</button><button type="button" onclick="submitWrite()">등록</button></div>
+"""
+
+HIDDEN_FIELDS = """<input type="hidden" name="id" value="{gallery_id}">
+<input type="hidden" name="r_key" value="{r_key}">
+<input type="hidden" name="memo" value="">"""
+
+CANVAS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body contenteditable="true"><p><br></p></body></html>
+"""
+
+UPLOAD_SCRIPT = """<script>
+function uploadFiles(input, endpoint, onUploaded, done) {
+    var files = Array.prototype.slice.call(input.files);
+    // 선택한 순서대로 하나씩 올린다
+    var next = function () {
+        var file = files.shift();
+        if (!file) {
+            if (done) { done(); }
+            return;
+        }
+        var data = new FormData();
+        data.append('files[]', file, file.name);
+        fetch(endpoint, {method: 'POST', body: data}).then(function (response) {
+            return response.json();
+        }).then(function (result) {
+            result.files.forEach(onUploaded);
+            next();
+        });
+    };
+    next();
+}
+</script>
+"""
+
+IMAGE_POPUP = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>사진 첨부</title></head>
+<body>
+<div><div>
+<div><input type="file" multiple accept="image/*" onchange="onFiles(this)"><ul id="sortable"></ul></div>
+<div><button type="button" onclick="applyImages()">적용</button></div>
+</div></div>
+{script}
+<script>
+function onFiles(input) {{
+    uploadFiles(input, '/upload/image_upload', function (file) {{
+        var li = document.createElement('li');
+        var img = document.createElement('img');
+        img.src = file.web__url;
+        li.appendChild(img);
+        document.getElementById('sortable').appendChild(li);
+    }});
+}}
+function applyImages() {{
+    var html = '';
+    document.querySelectorAll('#sortable li img').forEach(function (img) {{
+        html += '<p><img class="txc-image" src="' + img.src + '" style="clear:none;float:none;"></p>';
+    }});
+    window.opener.insertMedia(html);
+    window.close();
+}}
+</script>
+</body></html>
+"""
+
+MOVIE_POPUP = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>동영상 첨부</title></head>
+<body>
+<div id="movie_tmp"><div>
+<div><input type="file" accept="video/*" onchange="onFiles(this)"></div>
+<div><div><div id="movie_thumb"></div></div></div>
+<div><button type="button" onclick="applyMovie()">적용</button></div>
+</div></div>
+{script}
+<script>
+var uploaded = null;
+function onFiles(input) {{
+    uploadFiles(input, '/upload/movie_upload', function (file) {{
+        uploaded = file.web__url;
+        var img = document.createElement('img');
+        img.src = uploaded;
+        document.getElementById('movie_thumb').appendChild(img);
+    }});
+}}
+function applyMovie() {{
+    if (uploaded) {{
+        window.opener.insertMedia('<p><span class="video_inbox dc_movie_thumbox"><img src="' + uploaded + '"></span></p>');
+    }}
+    window.close();
+}}
+</script>
+</body></html>
+"""
+
+ALERT_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body><script>alert({message}); history.back();</script></body></html>
+"""
+
+
+def parse_multipart(content_type, body):
+    # multipart/form-data 를 (필드 dict, 파일 목록)으로 나눈다
+    message = BytesParser(policy=HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode() + b'\r\n\r\n' + body)
+    fields = {}
+    files = []
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        filename = part.get_filename()
+        payload = part.get_payload(decode=True) or b''
+        if filename:
+            files.append((name, filename, len(payload)))
+        else:
+            fields[name] = payload.decode('utf-8', 'replace')
+    return fields, files
+
+
+class MockSite:
+    def __init__(self, galleries=None, latency=0.0, upload_latency=None, posts_per_minute=None):
+        self.galleries = dict(galleries or DEFAULT_GALLERIES)
+        self.latency = latency
+        self.upload_latency = latency if upload_latency is None else upload_latency
+        # 최근 1분 동안 이보다 많이 올리면 도배 방지 메시지로 거절한다 (None 이면 제한 없음)
+        self.posts_per_minute = posts_per_minute
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.posts = []
+        self.uploads = []
+        # 로그인 세션 토큰. expire_sessions() 로 저장된 쿠키가 만료된 상황을 만든다
+        self.sessions = set()
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host='127.0.0.1', port=0):
+        class Handler(MockHandler):
+            site = self
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def add_post(self, gallery_id, fields):
+        with self.lock:
+            self.posts.append({'gallery_id': gallery_id, 'fields': fields, 'time': time.time()})
+            return len(self.posts)
+
+    def is_throttled(self):
+        if self.posts_per_minute is None:
+            return False
+        now = time.time()
+        with self.lock:
+            recent = sum(1 for post in self.posts if now - post['time'] < 60)
+            if recent >= self.posts_per_minute:
+                self.throttled += 1
+                return True
+        return False
+
+    def new_session(self):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions.add(token)
+        return token
+
+    def expire_sessions(self):
+        with self.lock:
+            self.sessions.clear()
+
+    def add_upload(self, kind, files):
+        with self.lock:
+            urls = []
+            for _, filename, size in files:
+                self.uploads.append({'kind': kind, 'filename': filename, 'size': size})
+                urls.append(f"{self.base_url}/media/{len(self.uploads)}/{filename}")
+            return urls
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    site = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body, content_type='text/html; charset=utf-8', status=200, headers=None):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_text(self, text):
+        self.send_body(text, content_type='text/plain; charset=utf-8')
+
+    def redirect(self, location, headers=None):
+        self.send_body('', status=303, headers=dict(headers or {}, Location=location))
+
+    def read_form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            return parse_multipart(content_type, body)
+        fields = {key: values[0] for key, values in parse_qs(body.decode('utf-8')).items()}
+        return fields, []
+
+    def query(self, name):
+        return parse_qs(urlparse(self.path).query).get(name, [''])[0]
+
+    def logged_in(self):
+        cookies = SimpleCookie(self.headers.get('Cookie') or '')
+        if SESSION_COOKIE not in cookies:
+            return False
+        with self.site.lock:
+            return cookies[SESSION_COOKIE].value in self.site.sessions
+
+    def board_path(self, path, suffix):
+        # /board/lists, /mgallery/board/lists 처럼 게시판 경로만 남긴다
+        return path[:-len(suffix)] if path.endswith(suffix) else None
+
+    def do_GET(self):
+        time.sleep(self.site.latency)
+        path = urlparse(self.path).path.rstrip('/')
+        gallery_id = self.query('id')
+        known_gallery = gallery_id in self.site.galleries.values()
+        list_board = self.board_path(path, '/lists')
+        write_board = self.board_path(path, '/write')
+
+        if path in ('', '/m', '/n'):
+            anchors = ''.join(f'<li><a href="/board/lists/?id={gid}">{escape(name)}</a></li>'
+                              for name, gid in self.site.galleries.items())
+            header = HEADER.format(account=LOGOUT_LINK if self.logged_in() else LOGIN_LINK)
+            self.send_body(HOME_PAGE.format(header=header, anchors=anchors))
+        elif path == '/login':
+            self.send_body(LOGIN_PAGE)
+        elif list_board is not None and known_gallery:
+            with self.site.lock:
+                rows = ''.join(f"<tr><td>{index}</td><td>{escape(post['fields'].get('subject', ''))}</td></tr>"
+                               for index, post in enumerate(self.site.posts, start=1)
+                               if post['gallery_id'] == gallery_id)
+            self.send_body(LIST_PAGE.format(gallery_id=gallery_id, board=list_board, rows=rows))
+        elif write_board is not None and known_gallery:
+            sizes = ''.join(f'<li><a href="javascript:;" onclick="setFontSize(\'{size}\')">{size}</a></li>'
+                            for size in FONT_SIZES)
+            editor = EDITOR.format(sizes=sizes)
+            hidden = HIDDEN_FIELDS.format(gallery_id=gallery_id, r_key=f"r{time.time_ns()}")
+            fields = (MEMBER_FIELDS if self.logged_in() else ANONYMOUS_FIELDS).format(hidden=hidden, editor=editor)
+            self.send_body(WRITE_PAGE.format(board=write_board, fields=fields, script=WRITE_SCRIPT))
+        elif path == '/editor/canvas':
+            self.send_body(CANVAS_PAGE)
+        elif path == '/upload/image':
+            self.send_body(IMAGE_POPUP.format(script=UPLOAD_SCRIPT))
+        elif path == '/upload/movie':
+            self.send_body(MOVIE_POPUP.format(script=UPLOAD_SCRIPT))
+        elif path.startswith('/media/'):
+            self.send_body(PIXEL_PNG, content_type='image/png')
+        else:
+            self.send_body('not found', status=404)
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip('/')
+        fields, files = self.read_form()
+        # 브라우저 폼은 redirect=1 로 보내고, HTTP 엔진은 "true||..." 텍스트 응답을 받는다
+        from_browser = self.query('redirect') == '1'
+
+        if path == '/login/member_check':
+            time.sleep(self.site.latency)
+            if fields.get('user_id') and fields.get('pw'):
+                cookie = {'Set-Cookie': f'{SESSION_COOKIE}={self.site.new_session()}; Path=/'}
+                if from_browser:
+                    self.redirect('/', cookie)
+                else:
+                    self.send_body('true||', content_type='text/plain; charset=utf-8', headers=cookie)
+            elif from_browser:
+                self.send_body(ALERT_PAGE.format(message=json.dumps('아이디 또는 비밀번호가 틀렸습니다')))
+            else:
+                self.send_text('false||아이디 또는 비밀번호가 틀렸습니다')
+        elif path in ('/upload/image_upload', '/upload/movie_upload'):
+            time.sleep(self.site.upload_latency)
+            kind = 'image' if 'image' in path else 'video'
+            urls = self.site.add_upload(kind, files)
+            body = json.dumps({'files': [{'web__url': url} for url in urls]})
+            self.send_body(body, content_type='application/json')
+        elif path.endswith('/forms/article_submit'):
+            time.sleep(self.site.latency)
+            gallery_id = fields.get('id', '')
+            if gallery_id not in self.site.galleries.values():
+                error = '존재하지 않는 갤러리입니다'
+            elif not fields.get('subject'):
+                error = '제목을 입력하세요'
+            elif self.site.is_throttled():
+                error = '도배 방지를 위해 잠시 후 다시 시도해주세요'
+            else:
+                error = None
+
+            if error and from_browser:
+                self.send_body(ALERT_PAGE.format(message=json.dumps(error)))
+            elif error:
+                self.send_text(f'false||{error}')
+            else:
+                number = self.site.add_post(gallery_id, fields)
+                if from_browser:
+                    board = path[:-len('/forms/article_submit')]
+                    self.redirect(f'{board}/lists/?id={gallery_id}')
+                else:
+                    self.send_text(f'true||{number}')
+        else:
+            self.send_body('not found', status=404)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="로컬 테스트용 디시인사이드 흉내 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help="요청마다 넣을 지연(초)")
+    parser.add_argument('--upload-latency', type=float, default=None, help="업로드 요청 지연(초)")
+    parser.add_argument('--posts-per-minute', type=int, default=None, help="넘으면 도배 방지 메시지로 거절")
+    args = parser.parse_args()
+
+    site = MockSite(latency=args.latency, upload_latency=args.upload_latency, posts_per_minute=args.posts_per_minute)
+    print(f"mock site: {site.start(args.host, args.port)}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()